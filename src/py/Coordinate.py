@@ -1,8 +1,16 @@
 class Coordinate:
+    __slots__ = ("x", "y", "_hash")
+    # The hash packs (x, y) like a flat index x * width + y, which never
+    # collides as long as |y| stays below half of the width.
+    HASH_WIDTH = 1 << 32
 
     def __init__(self, x: int, y: int) -> None:
-        self.x = x
-        self.y = y
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "_hash", x * self.HASH_WIDTH + y)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Coordinate is immutable")
 
     def __add__(self, other) -> any:
         if not isinstance(other, Coordinate):
@@ -15,7 +23,10 @@ class Coordinate:
         return False
 
     def __hash__(self):
-        return hash(7 * self.x * self.y)
+        return self._hash
+
+    def __reduce__(self):
+        return (Coordinate, (self.x, self.y))
 
     def __str__(self) -> str:
         return "({},{})".format(self.x, self.y)
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from Coordinate import Coordinate
+
+
+class CoordinateCache:
+    """Flyweight store that hands out one shared Coordinate per cell of a grid.
+
+    Coordinates are created the first time a cell is asked for, so hot loops
+    stepping between neighbours stop allocating new objects.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.coordinates: list[Coordinate | None] = [None] * (size * size)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def for_size(size: int) -> "CoordinateCache":
+        """Shared cache for every maze of the given size."""
+        return CoordinateCache(size)
+
+    def get(self, x: int, y: int) -> Coordinate:
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            # Outside of the grid, nothing to share.
+            return Coordinate(x, y)
+        index = x * self.size + y
+        coordinate = self.coordinates[index]
+        if coordinate is None:
+            coordinate = Coordinate(x, y)
+            self.coordinates[index] = coordinate
+        return coordinate
+
+    def neighbour(self, coordinate: Coordinate, movement: Coordinate) -> Coordinate:
+        return self.get(coordinate.x + movement.x, coordinate.y + movement.y)
@@ -1,8 +1,10 @@
+from collections.abc import Iterator
 import pandas as pd
 
 
 class FileReader:
     DELIMITER = ";"
+    CHUNK_SIZE = 1000
 
     def __init__(self):
         pass
@@ -10,3 +12,20 @@ class FileReader:
     def read_from_csv(self, path: str) -> pd.DataFrame:
         df: pd.DataFrame = pd.read_csv(path, delimiter=self.DELIMITER)
         return df.dropna()
+
+    def _normalize_decimals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Turns decimal commas ("0,5") into points, one column at a time."""
+        for column in df.columns:
+            if pd.api.types.is_string_dtype(df[column]):
+                df[column] = df[column].str.replace(",", ".", regex=False)
+        return df
+
+    def stream_from_csv(
+        self, path: str, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """Yields the file in chunks of rows instead of loading it at once."""
+        with pd.read_csv(
+            path, delimiter=self.DELIMITER, chunksize=chunk_size, dtype=str
+        ) as reader:
+            for chunk in reader:
+                yield self._normalize_decimals(chunk.dropna())
@@ -0,0 +1,17 @@
+from Maze import Maze
+
+
+class ImportReport:
+    def __init__(self):
+        self.mazes: list[Maze] = list()
+        # (line number in the source file, reason the row was skipped)
+        self.errors: list[tuple[int, str]] = list()
+
+    def add_maze(self, maze: Maze) -> None:
+        self.mazes.append(maze)
+
+    def add_error(self, line: int, message: str) -> None:
+        self.errors.append((line, message))
+
+    def has_errors(self) -> bool:
+        return len(self.errors) > 0
@@ -0,0 +1,82 @@
+from collections.abc import Callable
+import pickle
+import numpy as np
+from Coordinate import Coordinate
+from Maze import Maze
+
+
+class LazyMaze(Maze):
+    """Maze whose grid and counts are only read from storage when first used.
+
+    The grid and the count array are loaded separately, so looking at the
+    layout does not decode the counts. The memory loader returns None for a
+    maze that was never solved.
+    """
+
+    def __init__(
+        self,
+        start: Coordinate,
+        exit: Coordinate,
+        size: int,
+        grid_loader: Callable[[], np.ndarray],
+        memory_loader: Callable[[], np.ndarray | None],
+    ):
+        self._grid_loader = grid_loader
+        self._memory_loader = memory_loader
+        self._grid: np.ndarray | None = None
+        self._memory: np.ndarray | None = None
+        self.id: int | None = None
+        self.start = start
+        self.exit = exit
+        self.size = size
+        self.solved = False
+        self.solver: str | None = None
+        self.seed: int | None = None
+        self.constructive = False
+        self.stat = None
+
+    def __getstate__(self) -> dict:
+        # The loaders hold a database connection that only works on the thread
+        # that opened it, so the data must be loaded before pickling.
+        if self._grid is None or self._memory is None:
+            raise pickle.PicklingError("Call load() before pickling a LazyMaze")
+        state = self.__dict__.copy()
+        state["_grid_loader"] = None
+        state["_memory_loader"] = None
+        return state
+
+    def is_loaded(self) -> bool:
+        return self._grid is not None or self._memory is not None
+
+    def load(self) -> None:
+        """Reads the grid and the counts now, on the calling thread."""
+        self._load_memory()
+
+    def _load_grid(self) -> None:
+        if self._grid is None:
+            self._grid = self._grid_loader()
+
+    def _load_memory(self) -> None:
+        self._load_grid()  # A fresh count array needs the grid
+        if self._memory is None:
+            memory = self._memory_loader()
+            self._memory = memory if memory is not None else self._create_memory()
+
+    @property
+    def grid(self) -> np.ndarray:
+        self._load_grid()
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: np.ndarray) -> None:
+        self._grid = grid
+
+    @property
+    def memory(self) -> np.ndarray:
+        self._load_memory()
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: np.ndarray) -> None:
+        self._load_grid()
+        self._memory = memory
@@ -5,3 +5,4 @@ class LegendType(StrEnum):
     Start = "Start"
     End = "End"
     Solution = "Solution Path"
+    Traffic = "Solutions Through Cell"
@@ -1,37 +1,67 @@
+import numpy as np
 from Coordinate import Coordinate
 from CellType import CellType
 from MazeStat import MazeStat
 
 
 class Maze:
-    def __init__(
-        self, start: Coordinate, exit: Coordinate, layout: dict[Coordinate, CellType]
-    ):
+    # Cell codes stored in the grid, CELL_TYPES maps a code back to its CellType.
+    WALL = 0
+    PATH = 1
+    START = 2
+    EXIT = 3
+    CELL_TYPES = (CellType.Wall, CellType.Path, CellType.Start, CellType.Exit)
+
+    def __init__(self, start: Coordinate, exit: Coordinate, grid: np.ndarray):
         self.id: int | None = None
         self.start = start
         self.exit = exit
-        self.size = int(pow(len(layout), 0.5))
-        self.layout = layout
-        self.memory: dict[Coordinate, int] = {start: 1}
+        self.size = grid.shape[0]
+        self.grid = grid
+        self.memory = self._create_memory()
+        self.solved = False
+        self.solver: str | None = None
+        self.seed: int | None = None
+        self.constructive = False
         self.stat = None
 
+    def _create_memory(self) -> np.ndarray:
+        memory = np.zeros(self.grid.shape, dtype=np.int64)
+        if self._in_bounds(self.start):
+            memory[self.start.x, self.start.y] = 1
+        return memory
+
+    def _in_bounds(self, coord: Coordinate) -> bool:
+        return 0 <= coord.x < self.size and 0 <= coord.y < self.size
+
     def is_blockade(self, coord: Coordinate) -> bool:
-        if coord in self.layout:
-            return self.layout.get(coord) == CellType.Wall
+        if self._in_bounds(coord):
+            return bool(self.grid[coord.x, coord.y] == self.WALL)
         else:
             return None
 
+    def wall_density(self) -> float:
+        return np.count_nonzero(self.grid == self.WALL) / self.grid.size
+
     def get_memory_value(self, coord: Coordinate) -> int:
-        if coord in self.memory:
-            return self.memory.get(coord)
+        if self._in_bounds(coord):
+            return int(self.memory[coord.x, coord.y])
         else:
             return 0
 
+    def set_memory(self, memory: np.ndarray) -> None:
+        self.memory = memory
+        self.solved = True
+
+    def reset_memory(self) -> None:
+        self.memory = self._create_memory()
+        self.solved = False
+
     def update_solution_stat(self, time: float) -> None:
-        exit_value = self.memory.get(self.exit)
-        solution_value = exit_value if exit_value != None else 0
+        solution_value = self.get_memory_value(self.exit)
         self.stat.set_num_solutions(solution_value)
         self.stat.set_solution_time(time)
+        self.stat.set_solver(self.solver)
 
     def set_stat(self, stat: MazeStat) -> None:
         self.stat = stat
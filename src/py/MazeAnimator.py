@@ -0,0 +1,85 @@
+import numpy as np
+from PIL import Image
+from Maze import Maze
+from MazeRecorder import MazeRecorder
+from MazeVisualizer import MazeVisualizer
+
+
+class MazeAnimator:
+    """Encodes a MazeRecorder log as an animated GIF.
+
+    GIF frames are palette images, so the frames are built by patching the
+    changed cells into one reused buffer of palette indices, never by
+    redrawing a figure. Steps are decimated to at most max_frames frames,
+    which bounds both the time and the memory of the encoding.
+    """
+
+    MAX_FRAMES = 300
+    FRAME_DURATION = 40  # Milliseconds
+    FINAL_FRAME_DURATION = 2000
+    CELL_PIXELS = 2
+    # Palette index per recorded code: the cell colours, then the solutions
+    PALETTE = np.vstack(
+        (MazeVisualizer.PALETTE, MazeVisualizer.SOLUTION_COLOUR)
+    ).astype(np.uint8)
+
+    def __init__(
+        self,
+        max_frames: int = MAX_FRAMES,
+        frame_duration: int = FRAME_DURATION,
+        cell_pixels: int = CELL_PIXELS,
+    ):
+        self.max_frames = max_frames
+        self.frame_duration = frame_duration
+        self.cell_pixels = cell_pixels
+
+    def _frame(self, cells: np.ndarray) -> Image.Image:
+        frame = Image.fromarray(cells, mode="P")
+        frame.putpalette(self.PALETTE.ravel().tolist())
+        if self.cell_pixels > 1:
+            size = cells.shape[0] * self.cell_pixels
+            frame = frame.resize((size, size), Image.NEAREST)
+        return frame
+
+    def _steps_per_frame(
+        self, recorder: MazeRecorder, steps_per_frame: int | None
+    ) -> int:
+        # Never more than max_frames frames, the encoder holds all of them
+        least = max(-(-len(recorder) // self.max_frames), 1)  # Ceiling division
+        return least if steps_per_frame is None else max(steps_per_frame, least)
+
+    def frames(self, recorder: MazeRecorder, steps_per_frame: int | None = None):
+        """Yields a frame every steps_per_frame steps, and one for the end.
+        By default the steps are spread evenly over max_frames frames."""
+        steps_per_frame = self._steps_per_frame(recorder, steps_per_frame)
+        cells = np.full(recorder.size * recorder.size, Maze.WALL, dtype=np.uint8)
+        step = 0
+        for step, (indices, code) in enumerate(recorder.steps(), start=1):
+            if code == MazeRecorder.SOLUTION:
+                # Keep the start and exit colours
+                indices = indices[cells[indices] < Maze.START]
+            cells[indices] = code
+            if step % steps_per_frame == 0:
+                yield self._frame(cells.reshape(recorder.size, recorder.size))
+        if step % steps_per_frame != 0:
+            yield self._frame(cells.reshape(recorder.size, recorder.size))
+
+    def encode(
+        self, recorder: MazeRecorder, path: str, steps_per_frame: int | None = None
+    ) -> int:
+        """Writes the GIF, returns the number of frames in it. A steps_per_frame
+        that would give more than max_frames frames is raised to fit."""
+        steps_per_frame = self._steps_per_frame(recorder, steps_per_frame)
+        count = -(-len(recorder) // steps_per_frame)
+        durations = [self.frame_duration] * count
+        durations[-1] = self.FINAL_FRAME_DURATION
+        frames = self.frames(recorder, steps_per_frame)
+        next(frames).save(
+            path,
+            save_all=True,
+            append_images=frames,
+            duration=durations,
+            loop=0,
+            optimize=False,
+        )
+        return count
@@ -0,0 +1,366 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import time
+import warnings
+import matplotlib
+
+matplotlib.use("Agg")  # Render off screen, plt.show() becomes a no-op
+
+import matplotlib.pyplot as plt
+import numpy as np
+from Coordinate import Coordinate
+from Maze import Maze
+from MazeService import MazeService
+from MazeVisualizer import MazeVisualizer
+
+
+class _LegacyHashCoordinate(Coordinate):
+    """Coordinate with the old hash, where (2,3), (3,2) and (1,6) collide."""
+
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash(7 * self.x * self.y)
+
+
+class MazeBenchmark:
+    CARVE_SIZES = [10, 100, 500, 1000, 2000, 5000]
+    LOOKUP_SIZES = [10, 50, 100, 200]
+    SOLVABILITY_SIZES = [1000, 5000]
+    REPEATS = 3
+    SUITE_SIZES = [10, 50, 100, 500, 1000, 2000, 5000]
+    SUITE_SCARCITIES = [0.1, 0.5, 0.9]
+    # Solvers estimated above this many operations are left out of a sweep
+    SOLVE_COST_BUDGET = 1e8
+    # The console display prints every cell, and the plot needs a solved maze,
+    # whose counts take too much memory past a few thousand cells wide
+    PLOT_MAX_SIZE = 2000
+    DISPLAY_MAX_SIZE = 500
+    REGRESSION_TOLERANCE = 0.2
+    NOISE_FLOOR_SECONDS = 0.001
+
+    def __init__(self):
+        self.service = MazeService()
+        self.visualizer = MazeVisualizer()
+
+    def _best_time(self, action, repeats: int) -> float:
+        """Runs the action repeatedly and returns the fastest run in seconds."""
+        best = float("inf")
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            action()
+            best = min(best, time.perf_counter() - start_time)
+        return best
+
+    def carve_throughput(self, sizes: list[int] = None) -> list[dict]:
+        """Measures how many grid cells per second the carver fills."""
+        results = list()
+        for size in sizes or self.CARVE_SIZES:
+
+            def carve():
+                grid = np.zeros((size, size), dtype=np.uint8)
+                rng = np.random.default_rng(size)
+                self.service._iterative_backtrack(grid, size - 1, 1, rng)
+
+            seconds = self._best_time(carve, self.REPEATS)
+            results.append(
+                {
+                    "size": size,
+                    "seconds": seconds,
+                    "cells_per_second": size * size / seconds,
+                }
+            )
+        return results
+
+    def report_carve_throughput(self, sizes: list[int] = None) -> None:
+        print(f"{'Size':>8} {'Time (s)':>12} {'Cells/s':>14}")
+        for result in self.carve_throughput(sizes):
+            print(
+                f"{result['size']:>8} {result['seconds']:>12.4f} "
+                f"{result['cells_per_second']:>14,.0f}"
+            )
+
+    def coordinate_lookup(self, sizes: list[int] = None) -> list[dict]:
+        """Times looking up every cell of a Coordinate-keyed dict, old hash vs. new."""
+        results = list()
+        for size in sizes or self.LOOKUP_SIZES:
+            timings = dict()
+            for name, cls in (
+                ("legacy", _LegacyHashCoordinate),
+                ("packed", Coordinate),
+            ):
+                keys = [cls(x, y) for x in range(size) for y in range(size)]
+                layout = dict.fromkeys(keys, 0)
+
+                def lookup():
+                    for key in keys:
+                        layout[key]
+
+                timings[name] = self._best_time(lookup, self.REPEATS)
+            results.append(
+                {
+                    "size": size,
+                    "legacy_seconds": timings["legacy"],
+                    "packed_seconds": timings["packed"],
+                    "speedup": timings["legacy"] / timings["packed"],
+                }
+            )
+        return results
+
+    def report_coordinate_lookup(self, sizes: list[int] = None) -> None:
+        print(f"{'Size':>8} {'Legacy (s)':>12} {'Packed (s)':>12} {'Speedup':>9}")
+        for result in self.coordinate_lookup(sizes):
+            print(
+                f"{result['size']:>8} {result['legacy_seconds']:>12.5f} "
+                f"{result['packed_seconds']:>12.5f} {result['speedup']:>8.1f}x"
+            )
+
+    def solvability_speedup(self, sizes: list[int] = None) -> list[dict]:
+        """Times the bitset reachability check against the BFS on solvable mazes."""
+        results = list()
+        for size in sizes or self.SOLVABILITY_SIZES:
+            # Constructive mazes are always solvable, so neither check stops early
+            maze = self.service.generate(size, 0.5, constructive=True, seed=size)
+            start = (maze.start.x, maze.start.y)
+            exit = (maze.exit.x, maze.exit.y)
+            bitset = self._best_time(
+                lambda: self.service._is_solvable(start, exit, maze.grid), self.REPEATS
+            )
+            bfs = self._best_time(
+                lambda: self.service._is_solvable_bfs(start, exit, maze.grid), 1
+            )
+            results.append(
+                {
+                    "size": size,
+                    "bfs_seconds": bfs,
+                    "bitset_seconds": bitset,
+                    "speedup": bfs / bitset,
+                }
+            )
+        return results
+
+    def report_solvability_speedup(self, sizes: list[int] = None) -> None:
+        print(f"{'Size':>8} {'BFS (s)':>12} {'Bitset (s)':>12} {'Speedup':>9}")
+        for result in self.solvability_speedup(sizes):
+            print(
+                f"{result['size']:>8} {result['bfs_seconds']:>12.4f} "
+                f"{result['bitset_seconds']:>12.4f} {result['speedup']:>8.1f}x"
+            )
+
+    def _samples(self, action, repeats: int, setup=None) -> list[float]:
+        """Times every run of the action; setup runs untimed and feeds the action."""
+        samples = list()
+        for _ in range(repeats):
+            argument = setup() if setup is not None else None
+            start_time = time.perf_counter()
+            action(argument)
+            samples.append(time.perf_counter() - start_time)
+        return samples
+
+    def _summarize(
+        self, phase: str, size: int, scarcity: float, samples: list[float]
+    ) -> dict:
+        return {
+            "phase": phase,
+            "size": size,
+            "scarcity": scarcity,
+            "samples": samples,
+            "median": statistics.median(samples),
+            "min": min(samples),
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+
+    def _carve(self, size: int, seed: list[int]) -> np.ndarray:
+        grid = np.zeros((size, size), dtype=np.uint8)
+        rng = np.random.default_rng(seed)
+        self.service._iterative_backtrack(grid, size - 1, 1, rng)
+        grid[size - 1, 1] = Maze.START
+        grid[0, size - 2] = Maze.EXIT
+        return grid
+
+    def _sweep_point(self, size: int, scarcity: float, repeats: int) -> list[dict]:
+        """Times every phase for one (size, scarcity), all on the same seeded layout."""
+        seed = [size, round(scarcity * 100)]
+        start = (size - 1, 1)
+        exit = (0, size - 2)
+        carved = self._carve(size, seed)
+        grid = carved.copy()
+        self.service._convert_random_walls(grid, scarcity, np.random.default_rng(seed))
+        maze = self.service._create_maze_from_grid(grid)
+        wall_density = maze.wall_density()
+
+        phases = {
+            "carve": self._samples(lambda _: self._carve(size, seed), repeats),
+            "scarcity": self._samples(
+                lambda copy: self.service._convert_random_walls(
+                    copy, scarcity, np.random.default_rng(seed)
+                ),
+                repeats,
+                carved.copy,
+            ),
+            "is_solvable": self._samples(
+                lambda _: self.service._is_solvable(start, exit, grid), repeats
+            ),
+            "create_maze_from_grid": self._samples(
+                lambda _: self.service._create_maze_from_grid(grid), repeats
+            ),
+        }
+        for name in self.service.solvers.names():
+            solver = self.service.solvers.get(name)
+            if solver.estimate_cost(size, wall_density) <= self.SOLVE_COST_BUDGET:
+                phases[f"solve:{name}"] = self._samples(
+                    solver.solve, repeats, lambda: self._fresh_maze(grid)
+                )
+        if size <= self.PLOT_MAX_SIZE:
+            phases["plot_maze"] = self._samples(
+                self._plot, repeats, lambda: self._solved_maze(grid)
+            )
+        if size <= self.DISPLAY_MAX_SIZE:
+            phases["display_maze"] = self._samples(
+                self._display, repeats, lambda: self._solved_maze(grid)
+            )
+        return [
+            self._summarize(phase, size, scarcity, samples)
+            for phase, samples in phases.items()
+        ]
+
+    def _fresh_maze(self, grid: np.ndarray) -> Maze:
+        return self.service._create_maze_from_grid(grid.copy())
+
+    def _solved_maze(self, grid: np.ndarray) -> Maze:
+        maze = self._fresh_maze(grid)
+        self.service.solvers.get("wavefront").solve(maze)
+        return maze
+
+    def _plot(self, maze: Maze) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # Agg warns that show() does nothing
+            self.visualizer.plot_maze(maze)
+        plt.gcf().canvas.draw()  # Rasterize, show() no longer does it
+        plt.close("all")
+
+    def _display(self, maze: Maze) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.visualizer.display_maze(maze)
+
+    def suite(
+        self,
+        sizes: list[int] = None,
+        scarcities: list[float] = None,
+        repeats: int = None,
+    ) -> dict:
+        """Sweeps sizes and scarcities, timing every phase separately."""
+        repeats = repeats or self.REPEATS
+        results = list()
+        for size in sizes or self.SUITE_SIZES:
+            for scarcity in scarcities or self.SUITE_SCARCITIES:
+                results.extend(self._sweep_point(size, scarcity, repeats))
+        return {
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "repeats": repeats,
+            },
+            "results": results,
+        }
+
+    def write_results(self, results: dict, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(results, file, indent=2)
+
+    def load_results(self, path: str) -> dict:
+        with open(path) as file:
+            return json.load(file)
+
+    def compare(
+        self, results: dict, baseline: dict, tolerance: float = None
+    ) -> list[dict]:
+        """Lists the phases whose median got slower than the baseline allows.
+        Differences below the noise floor are never flagged."""
+        tolerance = self.REGRESSION_TOLERANCE if tolerance is None else tolerance
+        expected = {
+            (result["phase"], result["size"], result["scarcity"]): result["median"]
+            for result in baseline["results"]
+        }
+        regressions = list()
+        for result in results["results"]:
+            key = (result["phase"], result["size"], result["scarcity"])
+            if key not in expected:
+                continue
+            slowdown = result["median"] - expected[key]
+            if (
+                result["median"] > expected[key] * (1 + tolerance)
+                and slowdown > self.NOISE_FLOOR_SECONDS
+            ):
+                regressions.append(
+                    {
+                        "phase": result["phase"],
+                        "size": result["size"],
+                        "scarcity": result["scarcity"],
+                        "baseline": expected[key],
+                        "median": result["median"],
+                        "ratio": result["median"] / expected[key],
+                    }
+                )
+        return regressions
+
+    def report_suite(self, results: dict, regressions: list[dict] = None) -> None:
+        flagged = {
+            (regression["phase"], regression["size"], regression["scarcity"])
+            for regression in regressions or []
+        }
+        print(
+            f"{'Phase':<22} {'Size':>6} {'Scarcity':>9} {'Median (s)':>12} "
+            f"{'Min (s)':>10} {'Stdev':>9}"
+        )
+        for result in results["results"]:
+            key = (result["phase"], result["size"], result["scarcity"])
+            marker = "  REGRESSION" if key in flagged else ""
+            print(
+                f"{result['phase']:<22} {result['size']:>6} {result['scarcity']:>9} "
+                f"{result['median']:>12.5f} {result['min']:>10.5f} "
+                f"{result['stdev']:>9.5f}{marker}"
+            )
+        for regression in regressions or []:
+            print(
+                f"{regression['phase']} ({regression['size']};{regression['scarcity']}) "
+                f"is {regression['ratio']:.2f}x the baseline"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maze generator benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+")
+    parser.add_argument("--scarcities", type=float, nargs="+")
+    parser.add_argument("--repeats", type=int)
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float)
+    parser.add_argument(
+        "--micro", action="store_true", help="Run the old single-phase reports"
+    )
+    args = parser.parse_args()
+
+    benchmark = MazeBenchmark()
+    if args.micro:
+        benchmark.report_carve_throughput()
+        benchmark.report_coordinate_lookup()
+        benchmark.report_solvability_speedup()
+    else:
+        results = benchmark.suite(args.sizes, args.scarcities, args.repeats)
+        regressions = None
+        if args.baseline:
+            baseline = benchmark.load_results(args.baseline)
+            regressions = benchmark.compare(results, baseline, args.tolerance)
+        benchmark.report_suite(results, regressions)
+        if args.output:
+            benchmark.write_results(results, args.output)
+        if regressions:
+            raise SystemExit(1)
@@ -1,41 +1,178 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from ImportReport import ImportReport
+from MazeAnimator import MazeAnimator
+from MazeFile import MazeFile
+from MazePool import MazePool
+from MazeRecorder import MazeRecorder
+from MazeRenderer import MazeRenderer
 from MazeService import MazeService
 from Maze import Maze
 from MazeStat import MazeStat
+from MazeStatStore import MazeStatStore
+import json
+import numpy as np
 import pandas as pd
 import time
 
 
 class MazeController:
+    IMPORT_CHUNK_SIZE = 16
 
-    def __init__(self):
-        self.service = MazeService()
-        pass
+    def __init__(self, repo=None):
+        self.service = MazeService(repo)
+        self.maze_file = MazeFile()
 
-    def create_maze(self, size: int, scarcity: float) -> Maze | None:
-        start_time = time.time()
-        maze = self.service.generate(size, scarcity)
-        end_time = time.time()
+    def _build_maze(
+        self,
+        size: int,
+        scarcity: float,
+        constructive: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+        seed: int | np.random.Generator | None = None,
+    ) -> Maze | None:
+        start_time = time.perf_counter_ns()
+        maze = self.service.generate(size, scarcity, constructive, progress, seed)
+        end_time = time.perf_counter_ns()
         # Convert to milliseconds
-        build_time = round((end_time - start_time) * 1000, 2)
+        build_time = round((end_time - start_time) / 1e6, 2)
+        if maze is not None:
+            maze.stat.set_build_time(build_time)
+            return maze
+
+    def _solve(self, maze: Maze, strategy: str | None = None) -> Maze:
+        start_time = time.perf_counter_ns()
+        solved_maze = self.service.solve_maze(maze, strategy)
+        end_time = time.perf_counter_ns()
+        # Convert to milliseconds
+        solve_time = round((end_time - start_time) / 1e6, 2)
+        solved_maze.update_solution_stat(solve_time)
+        return solved_maze
+
+    def create_maze(
+        self,
+        size: int,
+        scarcity: float,
+        constructive: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+        seed: int | np.random.Generator | None = None,
+    ) -> Maze | None:
+        maze = self._build_maze(size, scarcity, constructive, progress, seed)
         if maze is not None:
-            stat = MazeStat(size, scarcity, build_time)
-            maze.set_stat(stat)
             return self.service.save_or_update_maze(maze)
 
+    def regenerate_maze(self, stat: MazeStat) -> Maze | None:
+        """Rebuilds a maze from its stats without saving it again."""
+        maze = self.service.regenerate(stat)
+        if maze is not None:
+            maze.set_stat(stat)
+        return maze
+
     def update_maze(self, maze: Maze) -> Maze:
         if maze is not None:
             return self.service.save_or_update_maze(maze)
 
-    def solve_maze(self, maze: Maze) -> Maze | None:
+    def solve_maze(self, maze: Maze, strategy: str | None = None) -> Maze | None:
         if maze is not None:
-            start_time = time.time()
-            solved_maze = self.service.solve_maze(maze)
-            end_time = time.time()
-            # Convert to milliseconds
-            solve_time = round((end_time - start_time) * 1000, 2)
-            maze.update_solution_stat(solve_time)
+            solved_maze = self._solve(maze, strategy)
             return self.service.save_or_update_maze(solved_maze)
 
+    def export_maze(self, maze: Maze, path: str, include_counts: bool = True) -> None:
+        if maze is not None:
+            self.maze_file.export_maze(maze, path, include_counts)
+
+    def import_maze_file(self, path: str) -> Maze:
+        maze = self.maze_file.load_maze(path)
+        maze.id = None  # IDs belong to the repository it came from
+        return self.service.save_or_update_maze(maze)
+
+    def enable_maze_pool(self, per_key: int = MazePool.PER_KEY) -> None:
+        self.service.enable_pool(per_key)
+
+    def get_maze_pool_stats(self) -> dict | None:
+        return self.service.get_pool_stats()
+
+    def get_solution_cache_stats(self) -> dict:
+        return self.service.get_solution_cache_stats()
+
+    def render_mazes(
+        self,
+        output_dir: str,
+        ids: list[int] | None = None,
+        workers: int | None = None,
+        thumbnail_size: int = MazeRenderer.THUMBNAIL_SIZE,
+    ) -> dict[str, list[int]]:
+        """Writes PNGs of the given mazes, or of all of them, skipping the unchanged."""
+        if ids is None:
+            mazes = self.find_all_mazes()
+        else:
+            mazes = [self.find_maze_by_id(id) for id in ids]
+        renderer = MazeRenderer(output_dir, thumbnail_size)
+        return renderer.render((maze for maze in mazes if maze is not None), workers)
+
+    def record_maze_animation(
+        self,
+        size: int,
+        scarcity: float,
+        path: str,
+        solve: bool = True,
+        constructive: bool = False,
+        seed: int | None = None,
+        steps_per_frame: int | None = None,
+    ) -> Maze | None:
+        """Generates, and optionally solves, a maze while recording every step,
+        then writes the animation as a GIF. The maze is not saved."""
+        recorder = MazeRecorder(size)
+        maze = self.service.generate(
+            size, scarcity, constructive, seed=seed, recorder=recorder
+        )
+        if maze is None:
+            return None
+        if solve:
+            self.service.solve_maze(maze, recorder=recorder)
+        MazeAnimator().encode(recorder, path, steps_per_frame)
+        return maze
+
+    def get_path(self, maze: Maze, k: int) -> list[tuple[int, int]] | None:
+        if maze is not None:
+            return self.service.get_path(maze, k)
+
+    def get_random_path(
+        self, maze: Maze, seed: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        if maze is not None:
+            return self.service.random_path(maze, seed)
+
+    def get_paths_through_cells(self, maze: Maze) -> np.ndarray | None:
+        if maze is not None:
+            return self.service.paths_through_cells(maze)
+
+    def find_bottlenecks(
+        self, maze: Maze, k: int = 10
+    ) -> list[tuple[int, int, int]] | None:
+        if maze is not None:
+            return self.service.bottleneck_cells(maze, k)
+
+    def get_stat_store(self) -> MazeStatStore:
+        return self.service.stat_store
+
+    def get_stat_records(self) -> list[dict]:
+        """One flat record per maze with stats, phase timings included."""
+        return [
+            {"id": maze.id, **maze.stat.to_record()}
+            for maze in self.service.get_all_mazes()
+            if maze.stat is not None
+        ]
+
+    def dump_stat_records(self, path: str) -> int:
+        """Writes the stat records as JSON lines, returns how many were written."""
+        records = self.get_stat_records()
+        with open(path, "w") as file:
+            for record in records:
+                file.write(json.dumps(record) + "\n")
+        return len(records)
+
     def find_maze_by_id(self, id: int) -> Maze:
         found = self.service.get_maze_by_id(id)
         if found != None:
@@ -47,19 +184,74 @@ class MazeController:
     def remove_maze_by_id(self, id: int) -> None:
         return self.service.remove_maze_by_id(id)
 
-    def import_mazes(self, df: pd.DataFrame) -> list[Maze]:
-        result: list[Maze] = list()
-        for values in df.to_numpy():
-            if len(values) == 2:
-                try:
-                    size = int(values[0])
-                    value_str = str(values[1]).replace(",", ".")
-                    scarcity = float(value_str)
-                    maze = self.create_maze(size, scarcity)
+    def _import_row(self, values) -> tuple[Maze | None, str | None]:
+        """Builds and solves one import row without saving it."""
+        if len(values) != 2:
+            return None, f"Expected 2 values, got {len(values)}"
+        try:
+            size = int(values[0])
+            # import_mazes takes any frame, not just normalised CSV chunks
+            value_str = str(values[1]).replace(",", ".")
+            scarcity = float(value_str)
+        except ValueError as e:
+            return None, str(e)
+        maze = self._build_maze(size, scarcity)
+        if maze is None:
+            return None, f"Could not generate a maze ({size};{scarcity})"
+        return self._solve(maze), None
+
+    def import_mazes(
+        self,
+        df: pd.DataFrame,
+        workers: int | None = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> ImportReport:
+        """Builds and solves a maze for every row. With more than one worker the
+        rows are spread over a process pool; either way the mazes are saved,
+        and so get their IDs, in row order."""
+        report = ImportReport()
+        for maze in self.stream_import_mazes([df], report, workers, chunk_size):
+            report.add_maze(maze)
+        return report
+
+    def stream_import_mazes(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        report: ImportReport | None = None,
+        workers: int | None = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Iterator[Maze]:
+        """Generates, solves and saves the rows chunk by chunk, yielding every maze
+        as soon as it is saved. Only one chunk is in flight at a time, so memory
+        stays bounded however long the input is. Skipped rows go to the report."""
+        with ExitStack() as stack:
+            executor = None
+            if workers is not None and workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(workers))
+            for chunk in chunks:
+                # Data rows count from 0, the file's lines from 1 after the header
+                lines = (chunk.index + 2).tolist()
+                values = chunk.to_numpy().tolist()
+                if executor is not None:
+                    results = executor.map(
+                        _import_row_in_worker, values, chunksize=chunk_size
+                    )
+                else:
+                    results = map(self._import_row, values)
+
+                for line, (maze, error) in zip(lines, results):
                     if maze is not None:
-                        self.solve_maze(maze)
-                        result.append(maze)
-                except ValueError as e:
-                    print(e)
+                        yield self.service.save_or_update_maze(maze)
+                    elif report is not None:
+                        report.add_error(line, error)
+
+
+_worker_controller: MazeController | None = None
+
 
-        return result
+def _import_row_in_worker(values) -> tuple[Maze | None, str | None]:
+    """Process pool entry point, every worker process keeps its own controller."""
+    global _worker_controller
+    if _worker_controller is None:
+        _worker_controller = MazeController()
+    return _worker_controller._import_row(values)
@@ -0,0 +1,219 @@
+import json
+import struct
+import numpy as np
+from Coordinate import Coordinate
+from Maze import Maze
+from MazeStat import MazeStat
+
+
+class MazeFileView:
+    """An opened maze file. Nothing but the header is read until a region is asked for."""
+
+    def __init__(self, path: str, header: dict):
+        self.path = path
+        self.header = header
+        self.size: int = header["size"]
+        self.start = Coordinate(*header["start"])
+        self.exit = Coordinate(*header["exit"])
+        row_bytes = (self.size + 7) // 8
+        self.walls = np.memmap(
+            path,
+            dtype=np.uint8,
+            mode="r",
+            offset=header["bitmap_offset"],
+            shape=(self.size, row_bytes),
+        )
+        self.counts: np.memmap | None = None
+        count_bytes = header["count_bytes"]
+        if count_bytes == 8:
+            self.counts = np.memmap(
+                path,
+                dtype="<i8",
+                mode="r",
+                offset=header["counts_offset"],
+                shape=(self.size, self.size),
+            )
+        elif count_bytes > 0:
+            self.counts = np.memmap(
+                path,
+                dtype=np.uint8,
+                mode="r",
+                offset=header["counts_offset"],
+                shape=(self.size, self.size, count_bytes),
+            )
+
+    def _region_counts(self, rows: slice, columns: slice) -> np.ndarray:
+        counts = np.asarray(self.counts[rows, columns])
+        if counts.ndim == 2:
+            return counts.astype(np.int64)
+        # Wider than int64: rebuild exact Python ints from the little-endian bytes
+        values = [
+            int.from_bytes(cell.tobytes(), "little")
+            for cell in counts.reshape(-1, counts.shape[2])
+        ]
+        return np.array(values, dtype=object).reshape(counts.shape[:2])
+
+    def region(self, x0: int, x1: int, y0: int, y1: int) -> Maze:
+        """Reads rows x0..x1 and columns y0..y1 (exclusive) into a square Maze.
+        Its start and exit are shifted along, and may lie outside of it."""
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.size), min(y1, self.size)
+        side = max(x1 - x0, y1 - y0)
+        x1, y1 = min(x0 + side, self.size), min(y0 + side, self.size)
+        rows, columns = slice(x0, x1), slice(y0, y1)
+
+        # Only the bytes holding the wanted columns are read
+        first_byte, last_byte = y0 // 8, (y1 + 7) // 8
+        packed = np.asarray(self.walls[rows, first_byte:last_byte])
+        bits = np.unpackbits(packed, axis=1, bitorder="little")
+        is_wall = bits[:, y0 - first_byte * 8 : y1 - first_byte * 8]
+        grid = np.zeros((side, side), dtype=np.uint8)  # Walls beyond the edge
+        grid[: x1 - x0, : y1 - y0] = np.where(is_wall, Maze.WALL, Maze.PATH)
+
+        start = Coordinate(self.start.x - x0, self.start.y - y0)
+        exit = Coordinate(self.exit.x - x0, self.exit.y - y0)
+        maze = Maze(start, exit, grid)
+        for coord, code in ((start, Maze.START), (exit, Maze.EXIT)):
+            if 0 <= coord.x < side and 0 <= coord.y < side:
+                grid[coord.x, coord.y] = code
+
+        if self.counts is not None:
+            memory = maze.memory
+            counts = self._region_counts(rows, columns)
+            if counts.dtype == object:
+                memory = memory.astype(object)
+            memory[: x1 - x0, : y1 - y0] = counts
+            maze.set_memory(memory)
+            maze.solver = self.header["solver"]
+        return maze
+
+    def load(self) -> Maze:
+        """Reads the whole maze, with its stats."""
+        maze = self.region(0, self.size, 0, self.size)
+        header = self.header
+        maze.seed = header["seed"]
+        maze.constructive = header["constructive"]
+        maze.solver = header["solver"]
+        stat = header["stat"]
+        if stat is not None:
+            maze_stat = MazeStat(
+                stat["size"],
+                stat["scarcity"],
+                stat["build_time"],
+                maze.seed,
+                maze.constructive,
+            )
+            maze_stat.set_solution_time(stat["solution_time"])
+            if stat["num_solutions"] is not None:
+                maze_stat.set_num_solutions(int(stat["num_solutions"]))
+            maze_stat.set_solver(stat["solver"])
+            if "profile" in stat:
+                maze_stat.set_profile(stat["profile"])
+            maze.set_stat(maze_stat)
+        return maze
+
+
+class MazeFile:
+    """Binary maze format.
+
+    Layout: an 8 byte magic, the version and header length as little-endian
+    uint32, a JSON header, then (aligned to ALIGNMENT bytes) the wall bitmap
+    with 1 bit per cell and ceil(size / 8) bytes per row, and optionally the
+    path counts as little-endian unsigned ints of count_bytes bytes each.
+    """
+
+    MAGIC = b"MAZEGEN\0"
+    VERSION = 1
+    ALIGNMENT = 64
+    BLOCK_ROWS = 1024
+
+    def _align(self, offset: int) -> int:
+        return -(-offset // self.ALIGNMENT) * self.ALIGNMENT
+
+    def _count_bytes(self, maze: Maze) -> int:
+        if not maze.solved:
+            return 0
+        if maze.memory.dtype != object:
+            return 8
+        largest = max(int(value) for value in maze.memory.ravel())
+        if largest <= np.iinfo(np.int64).max:
+            return 8
+        # 8 bytes are read back as int64, so anything larger takes at least 9
+        return max(9, (largest.bit_length() + 7) // 8)
+
+    def _stat_header(self, stat: MazeStat | None) -> dict | None:
+        if stat is None:
+            return None
+        return {
+            "size": stat.size,
+            "scarcity": stat.scarcity,
+            "build_time": stat.build_time,
+            "solution_time": stat.solution_time,
+            "num_solutions": (
+                str(stat.num_solutions) if stat.num_solutions is not None else None
+            ),
+            "solver": stat.solver,
+            "profile": stat.profile(),
+        }
+
+    def export_maze(self, maze: Maze, path: str, include_counts: bool = True) -> None:
+        """Writes the maze in row blocks. Huge counts take many bytes per cell,
+        include_counts=False keeps just the layout."""
+        size = maze.size
+        row_bytes = (size + 7) // 8
+        count_bytes = self._count_bytes(maze) if include_counts else 0
+        header = {
+            "size": size,
+            "start": [maze.start.x, maze.start.y],
+            "exit": [maze.exit.x, maze.exit.y],
+            "seed": maze.seed,
+            "constructive": maze.constructive,
+            "solved": maze.solved,
+            "solver": maze.solver,
+            "stat": self._stat_header(maze.stat),
+            "count_bytes": count_bytes,
+        }
+        # The offsets are part of the header, so size it with placeholders first
+        header["bitmap_offset"] = header["counts_offset"] = 0
+        prefix_length = len(self.MAGIC) + 8
+        header_length = len(json.dumps(header).encode("utf-8")) + 64
+        header["bitmap_offset"] = self._align(prefix_length + header_length)
+        header["counts_offset"] = self._align(
+            header["bitmap_offset"] + size * row_bytes
+        )
+        header_bytes = json.dumps(header).encode("utf-8").ljust(header_length)
+
+        with open(path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(struct.pack("<II", self.VERSION, header_length))
+            file.write(header_bytes)
+            file.seek(header["bitmap_offset"])
+            for first in range(0, size, self.BLOCK_ROWS):
+                block = maze.grid[first : first + self.BLOCK_ROWS] == Maze.WALL
+                file.write(np.packbits(block, axis=1, bitorder="little").tobytes())
+            if count_bytes > 0:
+                file.seek(header["counts_offset"])
+                for first in range(0, size, self.BLOCK_ROWS):
+                    block = maze.memory[first : first + self.BLOCK_ROWS]
+                    if count_bytes == 8:
+                        file.write(block.astype("<i8").tobytes())
+                    else:
+                        file.write(
+                            b"".join(
+                                int(value).to_bytes(count_bytes, "little")
+                                for value in block.ravel()
+                            )
+                        )
+
+    def open(self, path: str) -> MazeFileView:
+        with open(path, "rb") as file:
+            if file.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError(f"Not a maze file: {path}")
+            version, header_length = struct.unpack("<II", file.read(8))
+            if version != self.VERSION:
+                raise ValueError(f"Unsupported maze file version: {version}")
+            header = json.loads(file.read(header_length).decode("utf-8"))
+        return MazeFileView(path, header)
+
+    def load_maze(self, path: str) -> Maze:
+        return self.open(path).load()
@@ -0,0 +1,140 @@
+from collections import deque
+from collections.abc import Callable
+import queue
+import threading
+import time
+from Maze import Maze
+
+
+class MazePool:
+    """Warm pool of pre-generated mazes for frequently requested parameters.
+
+    A (size, scarcity, constructive) key becomes hot once it was asked for
+    HOT_THRESHOLD times; from then on a background thread keeps up to
+    per_key solvable mazes ready for it, within a total byte budget.
+    """
+
+    PER_KEY = 4
+    MAX_BYTES = 64 * 1024 * 1024
+    HOT_THRESHOLD = 2
+    POLL_TIME = 0.1
+
+    def __init__(
+        self,
+        generate: Callable[[int, float, bool], Maze | None],
+        per_key: int = PER_KEY,
+        max_bytes: int = MAX_BYTES,
+        hot_threshold: int = HOT_THRESHOLD,
+    ):
+        self.generate = generate
+        self.per_key = per_key
+        self.max_bytes = max_bytes
+        self.hot_threshold = hot_threshold
+        self.ready: dict[tuple, deque[Maze]] = dict()
+        self.requests: dict[tuple, int] = dict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # Running totals of the time spent per generated maze, in nanoseconds
+        self.refills = 0
+        self.refill_total_time = 0
+        self.refill_max_time = 0
+        self.lock = threading.Lock()
+        self.refill_queue: queue.Queue = queue.Queue()
+        self.pending: set[tuple] = set()
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def _maze_bytes(self, maze: Maze) -> int:
+        return maze.grid.nbytes + maze.memory.nbytes
+
+    def _schedule(self, key: tuple) -> None:
+        with self.lock:
+            if key in self.pending:
+                return
+            self.pending.add(key)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        self.refill_queue.put(key)
+
+    def warm(self, size: int, scarcity: float, constructive: bool = False) -> None:
+        """Marks the parameters as hot right away and starts filling them."""
+        key = (size, scarcity, constructive)
+        with self.lock:
+            self.requests[key] = max(self.requests.get(key, 0), self.hot_threshold)
+        self._schedule(key)
+
+    def take(
+        self, size: int, scarcity: float, constructive: bool = False
+    ) -> Maze | None:
+        """Returns a ready maze, or None when the caller has to generate one."""
+        key = (size, scarcity, constructive)
+        with self.lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+            is_hot = self.requests[key] >= self.hot_threshold
+            ready = self.ready.get(key)
+            maze = ready.popleft() if ready else None
+            if maze is not None:
+                self.hits += 1
+                self.bytes -= self._maze_bytes(maze)
+            else:
+                self.misses += 1
+        if is_hot:
+            self._schedule(key)
+        return maze
+
+    def _run(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                key = self.refill_queue.get(timeout=self.POLL_TIME)
+            except queue.Empty:
+                continue
+            self._refill(key)
+            with self.lock:
+                self.pending.discard(key)
+
+    def _refill(self, key: tuple) -> None:
+        while not self.stop_event.is_set():
+            with self.lock:
+                ready = self.ready.setdefault(key, deque())
+                if len(ready) >= self.per_key or self.bytes >= self.max_bytes:
+                    return
+            start_time = time.perf_counter_ns()
+            maze = self.generate(*key)
+            elapsed = time.perf_counter_ns() - start_time
+            if maze is None:
+                return  # Not solvable within the retries, try again on demand
+            maze_bytes = self._maze_bytes(maze)
+            with self.lock:
+                self.refills += 1
+                self.refill_total_time += elapsed
+                self.refill_max_time = max(self.refill_max_time, elapsed)
+                if self.bytes + maze_bytes > self.max_bytes:
+                    return
+                ready.append(maze)
+                self.bytes += maze_bytes
+
+    def stop(self) -> None:
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+            self.stop_event.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            refills = self.refills
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+                "ready": sum(len(ready) for ready in self.ready.values()),
+                "bytes": self.bytes,
+                "refills": refills,
+                "mean_refill_ms": (
+                    self.refill_total_time / refills / 1e6 if refills > 0 else None
+                ),
+                "max_refill_ms": self.refill_max_time / 1e6 if refills > 0 else None,
+            }
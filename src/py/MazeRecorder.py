@@ -0,0 +1,51 @@
+from array import array
+from collections.abc import Iterator
+import numpy as np
+from Maze import Maze
+
+
+class MazeRecorder:
+    """Log of the cells that every generation or solving step changed.
+
+    A step is a list of flat grid indices plus the code they were set to.
+    Everything lives in three flat arrays, a few bytes per changed cell,
+    so recording a carve costs about as much memory as the grid itself.
+    """
+
+    # Cells reached by the solver, one past the cell codes of Maze
+    SOLUTION = Maze.EXIT + 1
+
+    def __init__(self, size: int):
+        self.size = size
+        self.indices = array("q")
+        self.codes = array("B")
+        self.ends = array("q")  # End offset of every step in indices
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def reset(self) -> None:
+        """Forgets every step, for a generation attempt that starts over."""
+        self.indices = array("q")
+        self.codes = array("B")
+        self.ends = array("q")
+
+    def cells(self, indices, code: int) -> None:
+        """Records one step that set the given flat indices to code."""
+        self.indices.extend(indices)
+        self.codes.append(code)
+        self.ends.append(len(self.indices))
+
+    def coordinates(self, rows, columns, code: int) -> None:
+        """Records one step from row and column index arrays."""
+        flat = np.asarray(rows) * self.size + np.asarray(columns)
+        self.cells(flat.tolist(), code)
+
+    def steps(self) -> Iterator[tuple[np.ndarray, int]]:
+        """Yields the flat indices and the code of every step, in order."""
+        # A copy, a view would keep the log from growing while it is alive
+        indices = np.array(self.indices, dtype=np.int64)
+        start = 0
+        for end, code in zip(self.ends, self.codes):
+            yield indices[start:end], code
+            start = end
@@ -0,0 +1,162 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
+import matplotlib.image as mpimg
+import numpy as np
+from LazyMaze import LazyMaze
+from Maze import Maze
+from MazeVisualizer import MazeVisualizer
+
+
+class MazeRenderer:
+    """Writes full size and thumbnail PNGs of stored mazes, without a display.
+
+    The images come straight from the colour arrays through matplotlib's image
+    writer, so no figure is created and any backend works. A manifest next to
+    the images keeps a hash of every rendered layout, whether and by which
+    solver it was solved, and the image settings; mazes whose hash did not
+    change are skipped.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    THUMBNAIL_SIZE = 128
+    # Small mazes are scaled up so every cell is a visible block of pixels
+    MIN_FULL_SIZE = 512
+
+    def __init__(
+        self,
+        output_dir: str,
+        thumbnail_size: int = THUMBNAIL_SIZE,
+        min_full_size: int = MIN_FULL_SIZE,
+    ):
+        self.output_dir = output_dir
+        self.thumbnail_size = thumbnail_size
+        self.min_full_size = min_full_size
+        self.visualizer = MazeVisualizer()
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.output_dir, self.MANIFEST_NAME)
+
+    def _load_manifest(self) -> dict[str, str]:
+        if not os.path.exists(self._manifest_path()):
+            return dict()
+        with open(self._manifest_path()) as file:
+            return json.load(file)
+
+    def _save_manifest(self, manifest: dict[str, str]) -> None:
+        with open(self._manifest_path(), "w") as file:
+            json.dump(manifest, file, indent=2, sort_keys=True)
+
+    def paths(self, id: int) -> tuple[str, str]:
+        """The full size and the thumbnail image path of a maze."""
+        return (
+            os.path.join(self.output_dir, f"maze_{id}.png"),
+            os.path.join(self.output_dir, f"maze_{id}_thumb.png"),
+        )
+
+    def render_hash(self, maze: Maze) -> str:
+        """Hash of everything that shows in the images, the settings included.
+        The counts follow from the layout, but their shading depends on the
+        solver that wrote them, so that is hashed too."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            np.array(
+                (maze.size, self.thumbnail_size, self.min_full_size, maze.solved)
+            ).tobytes()
+        )
+        digest.update(str(maze.solver).encode("utf-8"))
+        digest.update(np.ascontiguousarray(maze.grid).tobytes())
+        return digest.hexdigest()
+
+    def _image(self, maze: Maze, pixels: int) -> np.ndarray:
+        """Samples a large maze down to about pixels wide, or scales a small one up."""
+        step = self.visualizer._image_step(maze.size, pixels)
+        image = self.visualizer.render_array(maze, step)
+        scale = pixels // image.shape[0]
+        if scale > 1:
+            image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+        return image
+
+    def render_maze(self, maze: Maze) -> tuple[str, str]:
+        """Writes both images of one maze and returns their paths."""
+        full_path, thumbnail_path = self.paths(maze.id)
+        full_pixels = max(maze.size, self.min_full_size)
+        mpimg.imsave(full_path, self._image(maze, full_pixels))
+        mpimg.imsave(thumbnail_path, self._image(maze, self.thumbnail_size))
+        return full_path, thumbnail_path
+
+    def _is_current(self, manifest: dict[str, str], maze: Maze, hash: str) -> bool:
+        return manifest.get(str(maze.id)) == hash and all(
+            os.path.exists(path) for path in self.paths(maze.id)
+        )
+
+    def render(self, mazes, workers: int | None = None) -> dict[str, list[int]]:
+        """Renders the mazes that changed since the last run, over a process
+        pool when there is more than one worker. Returns the rendered and the
+        skipped IDs."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        result = {"rendered": list(), "skipped": list()}
+        pending: list[tuple[Maze, str]] = list()
+        for maze in mazes:
+            hash = self.render_hash(maze)
+            if self._is_current(manifest, maze, hash):
+                result["skipped"].append(maze.id)
+            else:
+                pending.append((maze, hash))
+
+        if workers is not None and workers > 1 and len(pending) > 1:
+            # The mazes are pickled on a helper thread, where the repository
+            # connection cannot be used, so read them here first.
+            for maze, _ in pending:
+                if isinstance(maze, LazyMaze):
+                    maze.load()
+            with ProcessPoolExecutor(workers) as executor:
+                settings = (self.output_dir, self.thumbnail_size, self.min_full_size)
+                list(
+                    executor.map(
+                        _render_in_worker,
+                        [settings] * len(pending),
+                        [maze for maze, _ in pending],
+                    )
+                )
+        else:
+            for maze, _ in pending:
+                self.render_maze(maze)
+
+        for maze, hash in pending:
+            manifest[str(maze.id)] = hash
+            result["rendered"].append(maze.id)
+        self._save_manifest(manifest)
+        return result
+
+
+def _render_in_worker(settings: tuple, maze: Maze) -> tuple[str, str]:
+    """Process pool entry point."""
+    return MazeRenderer(*settings).render_maze(maze)
+
+
+if __name__ == "__main__":
+    from MazeController import MazeController
+    from SqliteMazeRepository import SqliteMazeRepository
+
+    parser = argparse.ArgumentParser(description="Render stored mazes to PNG files")
+    parser.add_argument("database", help="SQLite maze database")
+    parser.add_argument("output_dir")
+    parser.add_argument("--ids", type=int, nargs="+", help="Default: every maze")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--thumbnail-size", type=int, default=MazeRenderer.THUMBNAIL_SIZE
+    )
+    args = parser.parse_args()
+
+    controller = MazeController(SqliteMazeRepository(args.database))
+    result = controller.render_mazes(
+        args.output_dir, args.ids, args.workers, args.thumbnail_size
+    )
+    print(
+        f"Rendered {len(result['rendered'])} mazes, "
+        f"skipped {len(result['skipped'])} unchanged"
+    )
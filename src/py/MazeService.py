@@ -1,92 +1,237 @@
+from array import array
+from collections.abc import Callable, Iterator
 from collections import (
     deque,
 )  # Double ended queue for better stack managing | https://www.geeksforgeeks.org/deque-in-python/
 from Maze import Maze
 from Coordinate import Coordinate
-from CellType import CellType
+from MazeRecorder import MazeRecorder
 from MazeRepository import MazeRepository
+from MazePool import MazePool
 from MazeStat import MazeStat
-import random
-import sys
-import itertools  # Used for loading animation
-import pandas as pd
+from MazeStatStore import MazeStatStore
+from SolutionCache import SolutionCache
+from SolverRegistry import SolverRegistry
+from RecursiveSolver import RecursiveSolver
+from RowSweepSolver import RowSweepSolver
+from MemoizedSolver import MemoizedSolver
+from WavefrontSolver import WavefrontSolver
+import numpy as np
+import itertools  # Used for direction orders
 import time
 
 
-sys.setrecursionlimit(10_000)  # Increase recursion limit
-
-
 class MazeService:
-    SIZE_THRESHOLD = 15
     WALL_EXTEND_VALUE = 2
-
-    def __init__(self):
-        self.repo = MazeRepository()
-        pass
-
-    def _generate_maze(self, size: int, scarcity: float):
+    SCARCITY_BLOCK_ROWS = 1024
+    # Every ordering of Right, Down, Left, Up; each carved cell draws one at random.
+    DIRECTION_ORDERS = tuple(itertools.permutations([(0, 1), (1, 0), (0, -1), (-1, 0)]))
+
+    def __init__(self, repo=None, solution_cache: SolutionCache | None = None):
+        self.repo = repo if repo is not None else MazeRepository()
+        self.solution_cache = (
+            solution_cache if solution_cache is not None else SolutionCache()
+        )
+        self.pool: MazePool | None = None
+        self.stat_store = MazeStatStore()
+        self.stat_store.rebuild(self.repo.get_all_mazes())
+        self.solvers = SolverRegistry()
+        self.solvers.register(RecursiveSolver())
+        self.solvers.register(RowSweepSolver())
+        self.solvers.register(MemoizedSolver())
+        self.solvers.register(WavefrontSolver())
+
+    def _generate_maze(
+        self,
+        size: int,
+        scarcity: float,
+        rng: np.random.Generator,
+        progress: Callable[[int, int], None] | None = None,
+        stat: MazeStat | None = None,
+        recorder: MazeRecorder | None = None,
+    ):
+        """Generates the maze and ensures it is solvable.
+        With a stat, the time of every phase and attempt is recorded in it;
+        a recorder logs the cell changes of the attempt that succeeded."""
         num_of_tries = 20 - (scarcity * 10)
         counter = 0
-        spinner = itertools.cycle(["-", "\\", "|", "/"])  # Spinner animation
-        """Generates the maze and ensures it is solvable."""
         while True:
-            # Reset the grid and visited cells
-            grid = [["#" for _ in range(size)] for _ in range(size)]
-            visited = [[False for _ in range(size)] for _ in range(size)]
+            # Reset the grid, every cell starts out as a wall
+            grid = np.zeros((size, size), dtype=np.uint8)
             start = (size - 1, 1)  # Shift start cell to right by one.
             exit = (0, size - 2)  # Shift exit cell to left by one.
+            if recorder is not None:
+                recorder.reset()
 
             # Generate the maze (marked for matplotlib)
-            self._recursive_backtrack(grid, visited, size, start[0], start[1])
-            grid[start[0]][start[1]] = "S"
-            grid[exit[0]][exit[1]] = "E"
-            self._convert_random_walls(grid, scarcity)
+            carve_start = time.perf_counter_ns()
+            carved = self._iterative_backtrack(grid, start[0], start[1], rng, recorder)
+            grid[start] = Maze.START
+            grid[exit] = Maze.EXIT
+            self._record_start_and_exit(recorder, start, exit)
+            scarcity_start = time.perf_counter_ns()
+            self._convert_random_walls(grid, scarcity, rng, recorder)
 
             # Check if the maze is solvable with only right or up movements
-            if self._is_solvable(start, exit, grid):
+            check_start = time.perf_counter_ns()
+            solvable = self._is_solvable(start, exit, grid)
+            if stat is not None:
+                check_end = time.perf_counter_ns()
+                stat.add_phase("carve", scarcity_start - carve_start)
+                stat.add_phase("scarcity", check_start - scarcity_start)
+                stat.add_attempt(check_end - check_start)
+                stat.count("carved_cells", carved)
+            if solvable:
                 break  # Exit if solvable
             if counter < num_of_tries:
                 counter += 1
+                if stat is not None:
+                    stat.count("retries")
             else:
-                grid.clear()
+                grid = None
                 break
-            # Animated loading text
-            sys.stdout.write(f"\rGenerating solutions, please wait {next(spinner)} ")
-            sys.stdout.flush()
-            time.sleep(0.1)  # Short delay for animation
+            # Let the caller know about the retry, rendering is up to them
+            if progress is not None:
+                progress(counter, int(num_of_tries))
         return grid
 
-    def _recursive_backtrack(self, grid, visited, size, x, y):
-        """Carve a path recursively with backtracking."""
-        visited[x][y] = True
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
-        random.shuffle(directions)  # Randomize directions for maze randomness
+    def _generate_constructive_maze(
+        self,
+        size: int,
+        scarcity: float,
+        rng: np.random.Generator,
+        stat: MazeStat | None = None,
+        recorder: MazeRecorder | None = None,
+    ):
+        """Generates a maze that is solvable by construction, in a single pass."""
+        grid = np.zeros((size, size), dtype=np.uint8)
+        start = (size - 1, 1)  # Shift start cell to right by one.
+        exit = (0, size - 2)  # Shift exit cell to left by one.
+
+        # Reserve the corridor first, so it does not depend on the carved layout
+        carve_start = time.perf_counter_ns()
+        rows, columns = self._random_monotone_corridor(size, rng)
+        carved = self._iterative_backtrack(grid, start[0], start[1], rng, recorder)
+        grid[rows, columns] = Maze.PATH
+        grid[start] = Maze.START
+        grid[exit] = Maze.EXIT
+        if recorder is not None:
+            recorder.coordinates(rows, columns, Maze.PATH)
+        self._record_start_and_exit(recorder, start, exit)
+        # Only turns walls into paths, so the corridor stays intact
+        scarcity_start = time.perf_counter_ns()
+        self._convert_random_walls(grid, scarcity, rng, recorder)
+        if stat is not None:
+            stat.add_phase("carve", scarcity_start - carve_start)
+            stat.add_phase("scarcity", time.perf_counter_ns() - scarcity_start)
+            stat.count("carved_cells", carved)
+        return grid
 
-        for dx, dy in directions:
+    def _record_start_and_exit(
+        self, recorder: MazeRecorder | None, start: tuple, exit: tuple
+    ) -> None:
+        if recorder is not None:
+            recorder.coordinates([start[0]], [start[1]], Maze.START)
+            recorder.coordinates([exit[0]], [exit[1]], Maze.EXIT)
+
+    def _random_monotone_corridor(self, size: int, rng: np.random.Generator) -> tuple:
+        """Picks a random up/right corridor from above the start to below the exit."""
+        steps = size - 3  # Number of up (and of right) moves inside the outer walls
+        is_up = np.zeros(2 * steps, dtype=bool)
+        is_up[rng.choice(2 * steps, steps, replace=False)] = True
+        rows = size - 2 - np.concatenate(([0], np.cumsum(is_up)))
+        columns = 1 + np.concatenate(([0], np.cumsum(~is_up)))
+        return rows, columns
+
+    def _iterative_backtrack(
+        self,
+        grid: np.ndarray,
+        x: int,
+        y: int,
+        rng: np.random.Generator,
+        recorder: MazeRecorder | None = None,
+    ) -> int:
+        """Carve a path with backtracking, keeping the pending cells on an explicit stack.
+        Returns the number of cells visited; a recorder gets every carve as a step."""
+        size = grid.shape[0]
+        cells = memoryview(grid).cast("B")  # Flat, writable view of the grid
+        # Per cell: the direction ordering it uses (drawn up front, in one go)
+        # and how many directions it tried.
+        orders = memoryview(
+            rng.integers(0, len(self.DIRECTION_ORDERS), size * size, dtype=np.uint8)
+        )
+        tried = bytearray(size * size)
+        current = x * size + y
+        stack = array("q", [current])
+        visited = 1
+
+        while stack:
+            current = stack[-1]
+            step = tried[current]
+            if step == 4:
+                stack.pop()  # Every direction tried, backtrack
+                continue
+            tried[current] = step + 1
+            dx, dy = self.DIRECTION_ORDERS[orders[current]][step]
+            x, y = divmod(current, size)
             nx, ny = x + dx * 2, y + dy * 2  # Move two cells in that direction
 
-            # Check if the next cell is within bounds and unvisited
-            if 0 < nx < size - 1 and 0 < ny < size - 1 and not visited[nx][ny]:
-                # Carve a path to the next cell
-                grid[nx][ny] = "."
-                grid[x + dx][y + dy] = "."  # Carve between the current and next cell
-                self._recursive_backtrack(
-                    grid, visited, size, nx, ny
-                )  # Recursively visit the next cell
-
-    def _convert_random_walls(self, grid, scarcity):
-        """Randomly adds walls to the maze based on scarcity."""
-        size = len(grid[0])
-        for i in range(1, size - 1):  # Avoid outer walls
-            for j in range(1, size - 1):  # Avoid outer walls
-                if grid[i][j] == "#" and random.random() < scarcity:
-                    grid[i][j] = "."  # Change to path if within scarcity range
-
-    def _is_solvable(self, start, exit, grid):
+            # Check if the next cell is within bounds and still a wall (unvisited)
+            if 0 < nx < size - 1 and 0 < ny < size - 1:
+                target = nx * size + ny
+                if cells[target] == Maze.WALL:
+                    # Carve a path to the next cell
+                    cells[target] = Maze.PATH
+                    cells[current + dx * size + dy] = Maze.PATH  # Carve between
+                    stack.append(target)
+                    visited += 1
+                    if recorder is not None:
+                        recorder.cells((current + dx * size + dy, target), Maze.PATH)
+        return visited
+
+    def _convert_random_walls(
+        self,
+        grid: np.ndarray,
+        scarcity: float,
+        rng: np.random.Generator,
+        recorder: MazeRecorder | None = None,
+    ):
+        """Randomly turns walls into paths based on scarcity.
+        A recorder gets the converted cells of every row as a step."""
+        interior = grid[1:-1, 1:-1]  # Avoid outer walls
+        # Drawn in row blocks to bound memory; the stream of numbers is the
+        # same as one draw over the whole interior.
+        for first in range(0, interior.shape[0], self.SCARCITY_BLOCK_ROWS):
+            block = interior[first : first + self.SCARCITY_BLOCK_ROWS]
+            convert = (block == Maze.WALL) & (rng.random(block.shape) < scarcity)
+            block[convert] = Maze.PATH  # Change to path if within scarcity range
+            if recorder is not None:
+                for row, row_convert in enumerate(convert, start=first + 1):
+                    columns = np.flatnonzero(row_convert) + 1
+                    if len(columns):
+                        recorder.coordinates(row, columns, Maze.PATH)
+
+    def _is_solvable(self, start, exit, grid: np.ndarray) -> bool:
+        """Checks if the exit is reachable with up/right moves, one row at a time.
+        Each row is a Python int bitset, bit y being set when cell y is open."""
+        packed_rows = np.packbits(grid != Maze.WALL, axis=1, bitorder="little")
+        reach = 1 << start[1]
+        for x in range(start[0], exit[0] - 1, -1):
+            open_row = int.from_bytes(packed_rows[x].tobytes(), "little")
+            seeds = open_row & reach  # Cells entered from the row below
+            if not seeds:
+                return False
+            # Adding the seeds carries through each run of open cells, flipping
+            # every bit from a seed to the end of its run: that is rightward reach.
+            reach = open_row & (((open_row + seeds) ^ open_row) | seeds)
+        return bool(reach >> exit[1] & 1)
+
+    def _is_solvable_bfs(self, start, exit, grid: np.ndarray) -> bool:
         """Checks if there is a path from start to exit using Breadth-First Search (BFS)."""
         start_x, start_y = start
         exit_x, exit_y = exit
-        size = len(grid[0])
+        size = grid.shape[0]
+        is_wall = (grid == Maze.WALL).tolist()
         # BFS setup
         queue = deque([(start_x, start_y)])
         visited = [
@@ -107,58 +252,13 @@ class MazeService:
                     0 <= nx < size
                     and 0 <= ny < size
                     and not visited[nx][ny]
-                    and grid[nx][ny] != "#"
+                    and not is_wall[nx][ny]
                 ):
                     queue.append((nx, ny))
                     visited[nx][ny] = True
 
         return False
 
-    def _recursive_solve_maze(
-        self,
-        current_pos: Coordinate,
-        maze: Maze,
-    ) -> None:
-        movement_vectors: set[Coordinate] = {Coordinate(-1, 0), Coordinate(0, 1)}
-        for movement in movement_vectors:
-            new_pos: Coordinate = current_pos.__add__(movement)
-            if maze.is_blockade(new_pos) == False:
-                if new_pos in maze.memory:
-                    new_value: int = maze.memory.get(new_pos) + 1
-                    maze.memory[new_pos] = new_value
-                else:
-                    maze.memory[new_pos] = maze.memory.get(current_pos)
-                if new_pos != maze.exit:
-                    self._recursive_solve_maze(new_pos, maze)
-
-    def _solve_maze_linear(self, maze: Maze) -> None:
-        for j in range(maze.size - 1):
-            for i in range(maze.size):
-                if j > 0 and j < maze.size - 1 and i > 0 and i < maze.size:
-                    current = Coordinate(maze.size - 1 - j, i)
-                    if maze.is_blockade(current) == False:
-                        maze.memory[current] = self._calculate_memory_value(
-                            current, maze
-                        )
-        maze.memory[maze.exit] = maze.memory.get(maze.exit.__add__(Coordinate(1, 0)))
-
-    def _calculate_memory_value(self, current: Coordinate, maze: Maze) -> int:
-        left_neighbour = current.__add__(Coordinate(0, -1))
-        down_neighbour = current.__add__(Coordinate(1, 0))
-        left_value = maze.get_memory_value(left_neighbour)
-        down_value = maze.get_memory_value(down_neighbour)
-        if (
-            maze.is_blockade(left_neighbour) == False
-            and maze.is_blockade(down_neighbour) == False
-        ):
-            return left_value + down_value
-        elif maze.is_blockade(down_neighbour) == False:
-            return down_value
-        elif maze.is_blockade(left_neighbour) == False:
-            return left_value
-        else:
-            return 0
-
     def _get_start_pos(self, grid) -> tuple:
         size = len(grid[0])
         return (size - 1, 1)
@@ -167,88 +267,265 @@ class MazeService:
         size = len(grid[0])
         return (0, size - 2)
 
-    def _create_maze_from_grid(self, grid) -> Maze:
-        if len(grid) > 0:
-            size = len(grid[0])
+    def _create_maze_from_grid(self, grid: np.ndarray) -> Maze:
+        if grid is not None:
             start_pos = self._get_start_pos(grid)
             exit_pos = self._get_exit_pos(grid)
             start = Coordinate(start_pos[0], start_pos[1])
             exit = Coordinate(exit_pos[0], exit_pos[1])
-            layout: dict[Coordinate, CellType] = {
-                start: CellType.Start,
-                exit: CellType.Exit,
-            }
-            for i in range(size):
-                for j in range(size):
-                    current_coord = Coordinate(i, j)
-                    if grid[i][j] == "#":
-                        layout[current_coord] = CellType.Wall
-                    elif grid[i][j] == ".":
-                        layout[current_coord] = CellType.Path
-
-            return Maze(start, exit, layout)
-
-    def dfs_find_paths(self, maze, max_solutions=10000):
-        """Uses DFS (Depth-First Search) to find paths from start to exit, moving only UP or RIGHT.
-        Limits the number of solutions to max_solutions."""
-        size = maze.size
-        start = maze.start
-        exit = maze.exit
-
-        paths = []
-        visited = [
-            [False for _ in range(size)] for _ in range(size)
-        ]  # Visited cells for all paths
-
-        def dfs(x, y, path):
-            """Recursive DFS function to explore the maze."""
-            if (
-                len(paths) >= max_solutions
-            ):  # Stop searching once we hit the solution limit
-                return
-
-            if (x, y) == exit:
-                paths.append(path[:])  # Add the found path to the solutions
-                return
 
-            # Mark the current cell as visited
-            visited[x][y] = True
+            return Maze(start, exit, grid)
+
+    def _path_counts(self, maze: Maze) -> np.ndarray:
+        """The count table of the maze, solving it first if needed."""
+        if not maze.solved:
+            self.solve_maze(maze)
+        return maze.memory
+
+    def iter_paths(self, maze: Maze) -> Iterator[list[tuple[int, int]]]:
+        """Lazily yields every path from start to exit as a list of (x, y) cells.
+
+        Walks back from the exit and only steps onto cells with a non-zero
+        count, so every branch reaches the start and no work is wasted. Only
+        the current path is kept. Paths come in the order of get_path."""
+        memory = self._path_counts(maze)
+        start = (maze.start.x, maze.start.y)
+        exit = (maze.exit.x, maze.exit.y)
+        if memory[exit] == 0:
+            return
+        # Cells from the exit back, and the next predecessor to try for each
+        path = [exit]
+        choices = [0]
+        while path:
+            x, y = path[-1]
+            choice = choices[-1]
+            if (x, y) == start or choice == 2:
+                if choice == 0:
+                    yield path[::-1]
+                path.pop()
+                choices.pop()
+                continue
+            choices[-1] = choice + 1
+            # The cell below first, then the one to the left
+            nx, ny = (x + 1, y) if choice == 0 else (x, y - 1)
+            if nx < maze.size and ny >= 0 and memory[nx, ny] > 0:
+                path.append((nx, ny))
+                choices.append(0)
+
+    def get_path(self, maze: Maze, k: int) -> list[tuple[int, int]] | None:
+        """The k-th path from start to exit, counting from 0, or None past the last.
+
+        Every count is the sum of the counts below and to the left, so walking
+        back from the exit picks the side that holds the k-th path without
+        enumerating the ones before it: O(path length) steps for any k."""
+        memory = self._path_counts(maze)
+        x, y = maze.exit.x, maze.exit.y
+        if not 0 <= k < int(memory[x, y]):
+            return None
+        path = [(x, y)]
+        while (x, y) != (maze.start.x, maze.start.y):
+            below = int(memory[x + 1, y]) if x + 1 < maze.size else 0
+            if k < below:
+                x += 1
+            else:
+                k -= below
+                y -= 1
             path.append((x, y))
+        return path[::-1]
+
+    def random_path(
+        self, maze: Maze, seed: int | np.random.Generator | None = None
+    ) -> list[tuple[int, int]] | None:
+        """A uniformly random path from start to exit, or None if there is none."""
+        total = int(self._path_counts(maze)[maze.exit.x, maze.exit.y])
+        if total == 0:
+            return None
+        rng = np.random.default_rng(seed)
+        # The count can be far beyond int64, so draw random bits and reject
+        # the values past it; less than half are rejected on average.
+        num_bits = total.bit_length()
+        while True:
+            value = int.from_bytes(rng.bytes((num_bits + 7) // 8), "little")
+            value >>= -num_bits % 8
+            if value < total:
+                return self.get_path(maze, value)
+
+    def paths_through_cells(self, maze: Maze) -> np.ndarray:
+        """Number of start-to-exit paths through every cell: the paths from the
+        start to it times the paths from it to the exit.
+
+        The paths from a cell to the exit are the exit's down/left paths to the
+        cell, which are the up/right paths on the grid turned 180 degrees, so
+        both factors come from the wavefront counter."""
+        wavefront = self.solvers.get(WavefrontSolver.NAME)
+        is_open = maze.grid != Maze.WALL
+        last = maze.size - 1
+        forward = wavefront.count_paths(is_open, (maze.start.x, maze.start.y))
+        backward = wavefront.count_paths(
+            is_open[::-1, ::-1], (last - maze.exit.x, last - maze.exit.y)
+        )[::-1, ::-1]
+        if forward.dtype != object and backward.dtype != object:
+            largest = int(forward.max()) * int(backward.max())
+            if largest <= np.iinfo(np.int64).max:
+                return forward * backward
+        return forward.astype(object) * backward.astype(object)
+
+    def bottleneck_cells(
+        self, maze: Maze, k: int = 10, traffic: np.ndarray | None = None
+    ) -> list[tuple[int, int, int]]:
+        """The k cells most solutions pass through, besides the start and exit,
+        as (x, y, number of paths). A cell every solution passes through is
+        unavoidable."""
+        if traffic is None:
+            traffic = self.paths_through_cells(maze)
+        flat = traffic.ravel().copy()
+        for cell in (maze.start, maze.exit):
+            flat[cell.x * maze.size + cell.y] = 0
+        k = min(k, np.count_nonzero(flat))
+        if k == 0:
+            return []
+        top = np.argpartition(flat, len(flat) - k)[-k:]
+        top = top[np.argsort(flat[top], kind="stable")[::-1]]
+        return [
+            (int(index // maze.size), int(index % maze.size), int(flat[index]))
+            for index in top
+        ]
 
-            # Explore possible movements (Up, Right)
-            for dx, dy in [(-1, 0), (0, 1)]:  # Only UP or RIGHT
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < size
-                    and 0 <= ny < size
-                    and not visited[nx][ny]
-                    and maze.grid[nx][ny] != "#"
-                ):
-                    dfs(nx, ny, path)
-
-            # Backtrack
-            path.pop()
-            visited[x][y] = False
+    def dfs_find_paths(self, maze, max_solutions=10000):
+        """Returns up to max_solutions paths from start to exit, moving only UP or RIGHT."""
+        return list(itertools.islice(self.iter_paths(maze), max_solutions))
 
-        # Start DFS from the start cell
-        dfs(start[0], start[1], [])
+    def _new_seed(self) -> int:
+        return int(np.random.SeedSequence().generate_state(1, dtype=np.uint64)[0])
 
-        return paths
+    def _generate_new(
+        self,
+        size: int,
+        scarcity: float,
+        constructive: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+        seed: int | np.random.Generator | None = None,
+        recorder: MazeRecorder | None = None,
+    ) -> Maze:
+        if isinstance(seed, np.random.Generator):
+            rng, seed = seed, None
+        else:
+            seed = self._new_seed() if seed is None else seed
+            rng = np.random.default_rng(seed)
+        stat = MazeStat(size, scarcity, None, seed, constructive)
+        if constructive:
+            grid = self._generate_constructive_maze(size, scarcity, rng, stat, recorder)
+        else:
+            grid = self._generate_maze(size, scarcity, rng, progress, stat, recorder)
+        conversion_start = time.perf_counter_ns()
+        maze = self._create_maze_from_grid(grid)
+        if maze is not None:
+            stat.add_phase("conversion", time.perf_counter_ns() - conversion_start)
+            maze.seed = seed
+            maze.constructive = constructive
+            maze.set_stat(stat)
+        return maze
 
-    def generate(self, size: int, scarcity: float) -> Maze:
+    def generate(
+        self,
+        size: int,
+        scarcity: float,
+        constructive: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+        seed: int | np.random.Generator | None = None,
+        recorder: MazeRecorder | None = None,
+    ) -> Maze:
+        """Generates a maze, constructive mode skips the solvability retries.
+        progress is called with (attempt, max attempts) after every failed try.
+        The same integer seed always gives the same maze; without one a fresh
+        seed is drawn and kept on the maze, and a warm pool maze may be used.
+        A recorder logs every cell change of the generation."""
         if size - self.WALL_EXTEND_VALUE >= 2 and 0.1 <= scarcity <= 0.9:
-            grid = self._generate_maze(size, scarcity)
-            return self._create_maze_from_grid(grid)
-
-    def solve_maze(self, maze: Maze):
-        if maze.size < self.SIZE_THRESHOLD:
-            self._recursive_solve_maze(maze.start, maze)
+            if seed is None and self.pool is not None and recorder is None:
+                maze = self.pool.take(size, scarcity, constructive)
+                if maze is not None:
+                    maze.stat.count("pooled")
+                    return maze
+            return self._generate_new(
+                size, scarcity, constructive, progress, seed, recorder
+            )
+
+    def enable_pool(
+        self,
+        per_key: int = MazePool.PER_KEY,
+        max_bytes: int = MazePool.MAX_BYTES,
+        hot_threshold: int = MazePool.HOT_THRESHOLD,
+    ) -> MazePool:
+        """Starts keeping pre-generated mazes for frequently requested parameters."""
+        if self.pool is None:
+            self.pool = MazePool(self._generate_new, per_key, max_bytes, hot_threshold)
+        return self.pool
+
+    def disable_pool(self) -> None:
+        if self.pool is not None:
+            self.pool.stop()
+            self.pool = None
+
+    def get_pool_stats(self) -> dict | None:
+        if self.pool is not None:
+            return self.pool.stats()
+
+    def regenerate(self, stat: MazeStat) -> Maze:
+        """Rebuilds a maze from the parameters and seed kept in its stats."""
+        if stat.seed is not None:
+            return self.generate(
+                stat.size, stat.scarcity, stat.constructive, seed=stat.seed
+            )
+
+    def solve_maze(
+        self,
+        maze: Maze,
+        strategy: str | None = None,
+        recorder: MazeRecorder | None = None,
+    ):
+        """Solves with the named strategy, or the cheapest one for this maze.
+        Without a strategy, a layout that was solved before comes from the cache.
+        Recording needs a solver that runs, the wavefront one logs its progress."""
+        solve_start = time.perf_counter_ns()
+        key = self.solution_cache.key(maze)
+        if recorder is not None:
+            solver = self.solvers.get(WavefrontSolver.NAME)
+        elif strategy is not None:
+            solver = self.solvers.get(strategy)
+        else:
+            cached = self.solution_cache.get(key)
+            if cached is not None:
+                maze.set_memory(cached[0])
+                maze.solver = SolutionCache.SOLVER_NAME
+                self._record_solve(maze, solve_start, cache_hit=True)
+                return maze
+            solver = self.solvers.select(maze)
+        maze.reset_memory()
+        if recorder is not None:
+            solver.solve(maze, recorder)
         else:
-            self._solve_maze_linear(maze)
+            solver.solve(maze)
+        maze.solver = solver.NAME
+        self.solution_cache.put(key, maze.memory, solver.NAME)
+        self._record_solve(maze, solve_start)
         return maze
 
+    def _record_solve(
+        self, maze: Maze, solve_start: int, cache_hit: bool = False
+    ) -> None:
+        if maze.stat is not None:
+            maze.stat.set_phase("solve", time.perf_counter_ns() - solve_start)
+            maze.stat.counters["reached_cells"] = int(np.count_nonzero(maze.memory))
+            if cache_hit:
+                maze.stat.count("cache_hits")
+
+    def get_solution_cache_stats(self) -> dict:
+        return self.solution_cache.stats()
+
     def save_or_update_maze(self, maze: Maze) -> Maze:
-        return self.repo.save_or_update_maze(maze)
+        maze = self.repo.save_or_update_maze(maze)
+        self.stat_store.upsert(maze)
+        return maze
 
     def get_all_mazes(self) -> list[Maze]:
         return self.repo.get_all_mazes()
@@ -258,3 +535,4 @@ class MazeService:
 
     def remove_maze_by_id(self, id: int) -> None:
         self.repo.remove_maze(id)
+        self.stat_store.remove(id)
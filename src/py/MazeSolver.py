@@ -0,0 +1,38 @@
+import math
+import numpy as np
+from Maze import Maze
+
+
+class MazeSolver:
+    """Base class of the path counting strategies kept in the SolverRegistry.
+
+    The cost model is expressed in rough "Python operations", so the
+    estimates of different strategies can be compared directly.
+    """
+
+    NAME = None
+
+    def estimate_cost(self, size: int, wall_density: float) -> float:
+        raise NotImplementedError
+
+    def solve(self, maze: Maze) -> None:
+        raise NotImplementedError
+
+    def _estimate_log2_paths(self, size: int, wall_density: float) -> float:
+        """Rough, deliberately pessimistic log2 of the number of up/right paths."""
+        steps = max(size - 2, 1)
+        # Binomial(2 * steps, steps) monotone paths. Open cells cluster along the
+        # carved corridors, so only half of each path is charged for walls.
+        log_paths = (
+            math.lgamma(2 * steps + 1)
+            - 2 * math.lgamma(steps + 1)
+            + steps * math.log(max(1 - wall_density, 1e-9))
+        )
+        return log_paths / math.log(2)
+
+    def _counts_to_array(self, counts: list) -> np.ndarray:
+        """Packs the counts into an int64 array, or an object array if they overflow."""
+        largest = max(max(row) for row in counts)
+        if largest > np.iinfo(np.int64).max:
+            return np.array(counts, dtype=object)
+        return np.array(counts, dtype=np.int64)
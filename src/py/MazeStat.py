@@ -1,13 +1,75 @@
 class MazeStat:
-    def __init__(self, size: int, scarcity: float, build_time: float):
+    def __init__(
+        self,
+        size: int,
+        scarcity: float,
+        build_time: float,
+        seed: int | None = None,
+        constructive: bool = False,
+    ):
         self.size = size
         self.scarcity = scarcity
         self.build_time = build_time
+        self.seed = seed
+        self.constructive = constructive
         self.solution_time: float | None = None
         self.num_solutions: int | None = None
+        self.solver: str | None = None
+        # Nanoseconds spent per phase (carve, scarcity, solvability, conversion,
+        # solve) and in each solvability check, plus event counters.
+        self.phases: dict[str, int] = dict()
+        self.attempts: list[int] = list()
+        self.counters: dict[str, int] = dict()
+
+    def set_build_time(self, time: float) -> None:
+        self.build_time = time
 
     def set_solution_time(self, time: float) -> None:
         self.solution_time = time
 
     def set_num_solutions(self, value: int) -> None:
         self.num_solutions = value
+
+    def set_solver(self, name: str) -> None:
+        self.solver = name
+
+    def add_phase(self, name: str, nanoseconds: int) -> None:
+        self.phases[name] = self.phases.get(name, 0) + nanoseconds
+
+    def set_phase(self, name: str, nanoseconds: int) -> None:
+        self.phases[name] = nanoseconds
+
+    def add_attempt(self, nanoseconds: int) -> None:
+        self.attempts.append(nanoseconds)
+        self.add_phase("solvability", nanoseconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def profile(self) -> dict:
+        return {
+            "phases": dict(self.phases),
+            "attempts": list(self.attempts),
+            "counters": dict(self.counters),
+        }
+
+    def set_profile(self, profile: dict) -> None:
+        self.phases = dict(profile.get("phases", {}))
+        self.attempts = list(profile.get("attempts", []))
+        self.counters = dict(profile.get("counters", {}))
+
+    def to_record(self) -> dict:
+        """Flat, JSON-friendly view of the stats for offline analysis."""
+        return {
+            "size": self.size,
+            "scarcity": self.scarcity,
+            "seed": self.seed,
+            "constructive": self.constructive,
+            "build_time": self.build_time,
+            "solution_time": self.solution_time,
+            "num_solutions": (
+                str(self.num_solutions) if self.num_solutions is not None else None
+            ),
+            "solver": self.solver,
+            **self.profile(),
+        }
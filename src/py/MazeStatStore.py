@@ -0,0 +1,158 @@
+import math
+import numpy as np
+from Maze import Maze
+
+
+class MazeStatStore:
+    """Columnar copy of the maze stats, kept up to date as mazes are saved
+    or removed, so aggregates never have to walk the maze objects.
+
+    Every column is a NumPy array; a removed row is filled with the last one,
+    so rows are unordered. Missing times and counts are NaN.
+    """
+
+    INITIAL_CAPACITY = 1024
+    COLUMNS = {
+        "id": np.int64,
+        "size": np.int64,
+        "scarcity": np.float64,
+        "constructive": np.bool_,
+        "build_time": np.float64,
+        "solution_time": np.float64,
+        # num_solutions can be far beyond float range, so keep its log10
+        "log10_solutions": np.float64,
+        "solver": np.int16,
+    }
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.columns = {
+            name: np.zeros(capacity, dtype=dtype)
+            for name, dtype in self.COLUMNS.items()
+        }
+        self.rows: dict[int, int] = dict()  # Maze id -> row
+        self.solvers: list[str | None] = list()  # Solver code -> name
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of the live part of a column."""
+        view = self.columns[name][: self.count]
+        view.flags.writeable = False
+        return view
+
+    def _grow(self) -> None:
+        for name, values in self.columns.items():
+            grown = np.zeros(2 * len(values), dtype=values.dtype)
+            grown[: self.count] = values[: self.count]
+            self.columns[name] = grown
+
+    def _solver_code(self, name: str | None) -> int:
+        if name not in self.solvers:
+            self.solvers.append(name)
+        return self.solvers.index(name)
+
+    def upsert(self, maze: Maze) -> None:
+        """Adds or refreshes the row of a saved maze."""
+        if maze.stat is None:
+            self.remove(maze.id)
+            return
+        row = self.rows.get(maze.id)
+        if row is None:
+            if self.count == len(self.columns["id"]):
+                self._grow()
+            row = self.count
+            self.rows[maze.id] = row
+            self.count += 1
+        stat = maze.stat
+        values = {
+            "id": maze.id,
+            "size": stat.size,
+            "scarcity": stat.scarcity,
+            "constructive": stat.constructive,
+            "build_time": math.nan if stat.build_time is None else stat.build_time,
+            "solution_time": (
+                math.nan if stat.solution_time is None else stat.solution_time
+            ),
+            "log10_solutions": self._log10(stat.num_solutions),
+            "solver": self._solver_code(stat.solver),
+        }
+        for name, value in values.items():
+            self.columns[name][row] = value
+
+    def _log10(self, value: int | None) -> float:
+        if value is None:
+            return math.nan
+        if value <= 0:
+            return -math.inf
+        return math.log10(value)  # Exact enough for ints of any size
+
+    def remove(self, id: int) -> None:
+        row = self.rows.pop(id, None)
+        if row is None:
+            return
+        last = self.count - 1
+        if row != last:
+            for values in self.columns.values():
+                values[row] = values[last]
+            self.rows[int(self.columns["id"][row])] = row
+        self.count = last
+
+    def rebuild(self, mazes) -> None:
+        self.rows.clear()
+        self.count = 0
+        for maze in mazes:
+            self.upsert(maze)
+
+    def percentiles(
+        self, column: str = "build_time", q: tuple = (50, 90, 99)
+    ) -> dict[float, float]:
+        """Percentiles of a column over the mazes that have a value for it."""
+        values = self.column(column)
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return {p: math.nan for p in q}
+        return dict(zip(q, np.percentile(values, q).tolist()))
+
+    def latency_by_size(
+        self, column: str = "build_time", q: tuple = (50, 90)
+    ) -> dict[str, np.ndarray]:
+        """Per size: the number of mazes and the percentiles of a column.
+        Computed with one sort, interpolating like np.percentile."""
+        sizes = self.column("size")
+        values = self.column(column)
+        known = np.isfinite(values)
+        sizes, values = sizes[known], values[known]
+        order = np.lexsort((values, sizes))
+        sizes, values = sizes[order], values[order]
+        unique_sizes, starts, counts = np.unique(
+            sizes, return_index=True, return_counts=True
+        )
+        curves = {"size": unique_sizes, "count": counts}
+        for p in q:
+            position = starts + (counts - 1) * (p / 100)
+            below = np.floor(position).astype(np.int64)
+            above = np.minimum(below + 1, starts + counts - 1)
+            fraction = position - below
+            curves[f"p{p}"] = values[below] + (values[above] - values[below]) * fraction
+        return curves
+
+    def fit_vs_size(self, column: str = "solution_time") -> dict[str, float] | None:
+        """Least squares power law column ~ coefficient * size ** exponent,
+        fitted in log-log space. None without two distinct sizes to fit on."""
+        sizes = self.column("size").astype(np.float64)
+        values = self.column(column)
+        usable = np.isfinite(values) & (values > 0) & (sizes > 0)
+        log_sizes, log_values = np.log(sizes[usable]), np.log(values[usable])
+        if len(np.unique(log_sizes)) < 2:
+            return None
+        exponent, intercept = np.polyfit(log_sizes, log_values, 1)
+        predicted = intercept + exponent * log_sizes
+        residual = np.sum((log_values - predicted) ** 2)
+        total = np.sum((log_values - log_values.mean()) ** 2)
+        return {
+            "exponent": float(exponent),
+            "coefficient": float(math.exp(intercept)),
+            "r2": float(1 - residual / total) if total > 0 else 1.0,
+        }
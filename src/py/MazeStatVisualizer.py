@@ -1,34 +1,77 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
-from MazeStat import MazeStat
+from MazeStatStore import MazeStatStore
 
 sns.set_style("darkgrid")
 
 
 class MazeStatVisualizer:
+    # Scatter plots beyond this many points are drawn as hexbins instead
+    SCATTER_LIMIT = 5000
+
     def __init__(self):
         pass
 
-    def plot(self, stats: list[MazeStat]) -> None:
-        sizes = [stat.size for stat in stats]
-        build_times = [stat.build_time for stat in stats]
-        maze_ids = list(range(1, len(stats) + 1))
+    def _plot_against_size(self, ax, store: MazeStatStore, column: str) -> None:
+        sizes = store.column("size")
+        values = store.column(column)
+        known = np.isfinite(values)
+        if np.count_nonzero(known) > self.SCATTER_LIMIT:
+            ax.hexbin(sizes[known], values[known], gridsize=40, mincnt=1, cmap="Blues")
+        else:
+            ax.scatter(sizes[known], values[known], s=12, color="blue", alpha=0.5)
+
+        curves = store.latency_by_size(column)
+        ax.plot(curves["size"], curves["p50"], color="orange", label="Median")
+        ax.plot(curves["size"], curves["p90"], color="red", label="90th percentile")
+        ax.legend()
 
-        fig, axs = plt.subplots(1, 2, figsize=(12, 5))
+    def plot(self, store: MazeStatStore) -> None:
+        fig, axs = plt.subplots(2, 2, figsize=(12, 9))
 
         # Size vs Build Time
-        sns.scatterplot(x=sizes, y=build_times, ax=axs[0], color="blue", alpha=0.7)
-        axs[0].set_xlabel("Maze Size")
-        axs[0].set_ylabel("Build Time (s)")
-        axs[0].set_title("Maze Size vs. Build Time")
+        self._plot_against_size(axs[0, 0], store, "build_time")
+        axs[0, 0].set_xlabel("Maze Size")
+        axs[0, 0].set_ylabel("Build Time (ms)")
+        axs[0, 0].set_title("Maze Size vs. Build Time")
 
         # Histogram of Build Times
-        bins = sns.histplot(
-            build_times, bins=10, ax=axs[1], color="purple", kde=True, alpha=0.7
+        build_times = store.column("build_time")
+        sns.histplot(
+            build_times[np.isfinite(build_times)],
+            bins=10,
+            ax=axs[0, 1],
+            color="purple",
+            kde=True,
+            alpha=0.7,
         )
-        axs[1].set_xlabel("Build Time (s)")
-        axs[1].set_ylabel("Frequency")
-        axs[1].set_title("Distribution of Build Times")
+        axs[0, 1].set_xlabel("Build Time (ms)")
+        axs[0, 1].set_ylabel("Frequency")
+        axs[0, 1].set_title("Distribution of Build Times")
+
+        # Size vs Solution Time, with the fitted power law
+        self._plot_against_size(axs[1, 0], store, "solution_time")
+        fit = store.fit_vs_size("solution_time")
+        if fit is not None:
+            sizes = np.unique(store.column("size"))
+            axs[1, 0].plot(
+                sizes,
+                fit["coefficient"] * sizes.astype(np.float64) ** fit["exponent"],
+                color="green",
+                linestyle="--",
+                label=f"Fit: size^{fit['exponent']:.2f}",
+            )
+            axs[1, 0].legend()
+        axs[1, 0].set_xlabel("Maze Size")
+        axs[1, 0].set_ylabel("Solution Time (ms)")
+        axs[1, 0].set_title("Maze Size vs. Solution Time")
+
+        # Number of solutions, on a log scale since they grow exponentially
+        self._plot_against_size(axs[1, 1], store, "log10_solutions")
+        axs[1, 1].set_xlabel("Maze Size")
+        axs[1, 1].set_ylabel("log10(Number of Solutions)")
+        axs[1, 1].set_title("Maze Size vs. Number of Solutions")
 
         plt.tight_layout()
         plt.show()
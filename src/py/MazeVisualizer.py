@@ -1,19 +1,31 @@
+from collections.abc import Callable
+import shutil
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 from Maze import Maze
 from CellType import CellType
-from Coordinate import Coordinate
 from LegendType import LegendType
 
 
 class MazeVisualizer:
     GRID_SHIFT = 0.5
     NORMAL_FORM_THRESHOLD = 1000
-    CONSOLE_COLOURS = {
-        CellType.Start: "\033[34mS\033[0m",
-        CellType.Exit: "\033[31mE\033[0m",
-    }
+    # Level of detail: past these sizes the cells are too small to hold a
+    # label or to show grid lines, and images wider than MAX_IMAGE_SIZE
+    # are downsampled since they have more cells than the figure has pixels.
+    LABEL_MAX_SIZE = 40
+    GRID_MAX_SIZE = 150
+    MAX_IMAGE_SIZE = 1000
+    # Console colour codes: none, start, exit and solution paths
+    CONSOLE_STYLES = ("", "\033[34m", "\033[31m", "\033[32m")
+    CONSOLE_RESET = "\033[0m"
+    CONSOLE_CLEAR = "\033[H\033[2J"
+    # Page scrolling: command -> (rows, columns) in half pages
+    PAGE_MOVES = {"w": (-1, 0), "s": (1, 0), "a": (0, -1), "d": (0, 1)}
+    PAGE_STATUS_LINES = 2
     CELL_TYPE_COLOURS = {
         # WALL: purple
         CellType.Wall: [68, 1, 84],
@@ -24,6 +36,14 @@ class MazeVisualizer:
         # END: red
         CellType.Exit: [193, 59, 50],
     }
+    PALETTE = np.array(
+        list(map(CELL_TYPE_COLOURS.get, Maze.CELL_TYPES)), dtype=np.uint8
+    )
+    SOLUTION_COLOUR = (52, 250, 112)  # #34FA70
+    MIN_SOLUTION_COLOUR = (0, 100, 0)
+    CONSOLE_CHARACTERS = np.array(
+        [str(cell_type) for cell_type in Maze.CELL_TYPES], dtype=object
+    )
     LEGEND_LABEL_COLOURS = {
         LegendType.Start: [35 / 255, 129 / 255, 214 / 255, 1],
         LegendType.End: [193 / 255, 59 / 255, 50 / 255, 1],
@@ -33,56 +53,79 @@ class MazeVisualizer:
     def __init__(self):
         pass
 
-    def _create_maze_array_from_maze(self, maze: Maze):
-        maze_array = np.zeros((maze.size, maze.size, 3), dtype=int)
+    def _create_maze_array_from_maze(self, maze: Maze, step: int = 1):
+        """Colours every step-th cell of every step-th row, step 1 being all of them."""
+        # Convert maze to color array, indexing the palette with the cell codes
+        maze_array = self.PALETTE[maze.grid[::step, ::step]]
+        self._stamp_start_and_exit(maze_array, maze, step)
+        return maze_array
 
-        # Convert maze to color array
-        for key, value in maze.layout.items():
-            if value in self.CELL_TYPE_COLOURS:
-                maze_array[key.x, key.y] = self.CELL_TYPE_COLOURS.get(value)
+    def _stamp_start_and_exit(self, maze_array, maze: Maze, step: int) -> None:
+        """Keeps the start and exit visible when they fall between samples."""
+        if step > 1:
+            for cell, code in ((maze.start, Maze.START), (maze.exit, Maze.EXIT)):
+                # A region's start and exit may lie outside of it
+                if maze._in_bounds(cell):
+                    maze_array[cell.x // step, cell.y // step] = self.PALETTE[code]
 
-        return maze_array
+    def _update_display_maze_by_solutions(self, maze_array, maze: Maze, step: int = 1):
+        num_solutions = np.count_nonzero(maze.memory)  # Over the whole maze
+        memory = maze.memory[::step, ::step]
+        visited = memory > 0
+        # Keep the start and exit colours
+        visited &= maze.grid[::step, ::step] < Maze.START
+        # Adjust color based on the number of times each cell is visited
+        maze_array[visited] = self._adjust_color_based_on_visits(
+            base_color=self.SOLUTION_COLOUR,
+            num_visits=memory[visited],
+            num_solutions=num_solutions,
+        )
+        self._stamp_start_and_exit(maze_array, maze, step)
 
-    def _update_display_maze_by_solutions(self, maze_array, maze: Maze):
-        solutions = maze.memory
-        for key, value in solutions.items():
-            if key != maze.start and key != maze.exit:
-                # Adjust color based on the number of times the cell is visited
-                darkened_color = self._adjust_color_based_on_visits(
-                    base_color=(52, 250, 112),  # Original color: #34FA70
-                    num_visits=value,
-                    num_solutions=len(solutions),  # Pass number of solutions here
-                )
-                maze_array[key.x, key.y] = darkened_color  # Apply the darkened color
+    def _update_display_maze_by_traffic(
+        self, maze_array, maze: Maze, traffic: np.ndarray, step: int = 1
+    ):
+        """Shades every cell by the share of all solutions that pass through it."""
+        num_solutions = traffic[maze.exit.x, maze.exit.y]  # Every path ends there
+        if num_solutions == 0:
+            return
+        traffic = traffic[::step, ::step]
+        visited = traffic > 0
+        # Keep the start and exit colours
+        visited &= maze.grid[::step, ::step] < Maze.START
+        maze_array[visited] = self._adjust_color_based_on_visits(
+            base_color=self.SOLUTION_COLOUR,
+            num_visits=traffic[visited],
+            num_solutions=num_solutions,
+        )
+        self._stamp_start_and_exit(maze_array, maze, step)
 
     def _adjust_color_based_on_visits(self, base_color, num_visits, num_solutions):
-        """Darkens the color based on the number of visits, with a consistent gradient scaling."""
+        """Darkens the color based on the number of visits, with a consistent gradient scaling.
+        Takes an array of visit counts and returns one RGB row per count."""
+        base_rgb = np.array(base_color, dtype=np.float64)
 
         # If there is only one solution, return the original base color
         if num_solutions == 1:
-            return base_color
-
-        # Convert the base color to array
-        base_rgb = np.array(base_color)
+            return np.broadcast_to(base_rgb, (len(num_visits), 3))
 
         # Normalize the number of visits to a range between 0 and 1
-        normalized_visits = num_visits / num_solutions
+        if num_visits.dtype == object:
+            # Counts past the float range darken fully anyway, so cap them,
+            # and divide the Python ints exactly before going to floats
+            num_visits = np.minimum(num_visits, 256 * num_solutions)
+            normalized_visits = (num_visits / num_solutions).astype(np.float64)
+        else:
+            normalized_visits = num_visits.astype(np.float64) / num_solutions
 
         darken_factor = normalized_visits * 255  # Scale between RGB values of 0 and 255
 
-        # Darken the color by subtracting the darken_factor from each RGB component
-        darkened_rgb = np.maximum(
-            base_rgb - darken_factor, 0
-        )  # Ensure no value goes below 0
-        darkened_rgb = np.minimum(darkened_rgb, 255)  # Ensure no value goes above 255
-
-        # Set a minimum so the darkest spots aren't pitch black.
-        min_threshold = np.array([0, 100, 0])
-
-        # Ensure the darkened color does not go below the minimum threshold
-        darkened_rgb = np.maximum(darkened_rgb, min_threshold)
-
-        return darkened_rgb
+        # Darken the color by subtracting the darken_factor from each RGB component.
+        # Visits are positive, so it never goes above the base color, and the
+        # minimum keeps it from going below 0 and the darkest spots from being
+        # pitch black.
+        darkened_rgb = base_rgb - darken_factor[:, np.newaxis]
+        return np.maximum(darkened_rgb, self.MIN_SOLUTION_COLOUR)
 
     def _calculate_normal_form(self, num: int) -> str:
         new_value, power = self._recursive_calculate_normal_form(num)
@@ -97,47 +140,108 @@ class MazeVisualizer:
             return 0, 0
         return self._recursive_calculate_normal_form(num / 10, pow + 1)
 
-    def _display_cell(
+    def render_array(
+        self, maze: Maze, step: int = 1, traffic: np.ndarray | None = None
+    ) -> np.ndarray:
+        """The RGB image of the maze, solutions shaded, one pixel per step cells.
+        With traffic, the paths through each cell, cells are shaded by that."""
+        maze_array = self._create_maze_array_from_maze(maze, step)
+        if traffic is not None:
+            self._update_display_maze_by_traffic(maze_array, maze, traffic, step)
+        elif maze.solved:
+            self._update_display_maze_by_solutions(maze_array, maze, step)
+        return maze_array
+
+    def _image_step(self, size: int, pixels: int = MAX_IMAGE_SIZE) -> int:
+        """Cells per pixel that keep the image at most pixels wide."""
+        return -(-size // pixels)  # Ceiling division
+
+    def _draw_labels(self, ax, counts: np.ndarray) -> None:
+        """Display the number of visits for each cell in the center of each cell"""
+        for x, y in np.argwhere(counts >= 1):
+            value = int(counts[x, y])
+            display_value = str(value)
+            display_size = 10
+            if value >= self.NORMAL_FORM_THRESHOLD:
+                display_value = self._calculate_normal_form(value)
+                display_size = 5
+
+            ax.text(
+                y,  # x-coordinate
+                x,  # y-coordinate
+                display_value,  # Display the number of visits
+                ha="center",
+                va="center",  # Center the text
+                fontsize=display_size,
+                color="black",
+                weight="bold",
+            )
+
+    def _draw_grid(self, ax, size: int) -> None:
+        """Draws every grid line as one LineCollection, shifted by 0.5 units left and up."""
+        positions = np.arange(size + 1) - self.GRID_SHIFT
+        low = np.full(size + 1, 0 - self.GRID_SHIFT)
+        high = np.full(size + 1, size - self.GRID_SHIFT)
+        horizontal = np.stack(
+            (np.column_stack((low, positions)), np.column_stack((high, positions))),
+            axis=1,
+        )
+        vertical = horizontal[:, :, ::-1]  # The same lines with x and y swapped
+        lines = LineCollection(
+            np.concatenate((horizontal, vertical)),
+            colors="gray",
+            linewidths=1,
+            alpha=0.5,
+        )
+        ax.add_collection(lines)
+
+    def plot_maze(
         self,
-        grid: dict[Coordinate, CellType],
-        solution: dict[Coordinate, int],
-        current: Coordinate,
+        maze: Maze,
+        detail: bool | None = None,
+        traffic: np.ndarray | None = None,
     ):
-        """Handles the display of individual cells with color coding."""
-        if current in grid:
-            cell_value = grid.get(current)
-            if cell_value in self.CONSOLE_COLOURS:
-                if len(solution) > 1 and solution.get(current) != None:
-                    solution_value = solution.get(current)
-                    if solution_value > self.NORMAL_FORM_THRESHOLD:
-                        solution_value = self._calculate_normal_form(solution_value)
-                    print_value = self.CONSOLE_COLOURS.get(cell_value)
-                    if cell_value == CellType.Exit:
-                        print_value = print_value.replace("E", str(solution_value))
-                    print(print_value, end=" ")
-                else:
-                    print(self.CONSOLE_COLOURS.get(cell_value), end=" ")
-            else:
-                print(cell_value, end=" ")
-
-    def plot_maze(self, maze: Maze):
         """Plots the maze and highlights the solution paths in different shades of green,
-        with shared paths being darker and unique ones brighter."""
-        maze_array = self._create_maze_array_from_maze(maze)
+        with shared paths being darker and unique ones brighter. With traffic,
+        the number of solutions through every cell, that is shown instead.
+
+        Labels and grid lines are only drawn while the cells are large enough to
+        show them, and big mazes are downsampled to a colour-only image, so the
+        drawing time does not grow with the maze size. detail=True always draws
+        everything, detail=False never does."""
+        step = 1 if detail else self._image_step(maze.size)
+        maze_array = self.render_array(maze, step, traffic)
         legends = {
             LegendType.Start: self.LEGEND_LABEL_COLOURS.get(LegendType.Start),
             LegendType.End: self.LEGEND_LABEL_COLOURS.get(LegendType.End),
         }
         title = "Maze"
-        if len(maze.memory) > 1:
-            self._update_display_maze_by_solutions(maze_array, maze)
+        if maze.solved:
             legends[LegendType.Solution] = self.LEGEND_LABEL_COLOURS.get(
                 LegendType.Solution
             )
             title = "Maze Solutions"
+        if traffic is not None:
+            legends[LegendType.Traffic] = self.LEGEND_LABEL_COLOURS.get(
+                LegendType.Solution
+            )
+            legends.pop(LegendType.Solution, None)
+            title = "Solutions Through Each Cell"
+
+        if detail is None:
+            show_labels = maze.size <= self.LABEL_MAX_SIZE
+            show_grid = maze.size <= self.GRID_MAX_SIZE
+        else:
+            show_labels = show_grid = detail
 
         fig, ax = plt.subplots()
-        ax.imshow(maze_array)
+        # The extent keeps the axes in cell units, downsampled or not
+        edges = (0 - self.GRID_SHIFT, maze.size - self.GRID_SHIFT)
+        ax.imshow(
+            maze_array,
+            interpolation="nearest",
+            extent=(edges[0], edges[1], edges[1], edges[0]),
+        )
         ax.axis("off")
 
         # Title and legend
@@ -149,57 +253,109 @@ class MazeVisualizer:
         plt.title(title, fontsize=14)
         plt.legend(handles=patches, bbox_to_anchor=(1.3, 1.1))
 
-        # Display the number of visits for each cell in the center of each cell
-        if len(maze.memory) > 1:
-            for key, value in maze.memory.items():
-                display_value = str(value)
-                display_size = 10
-                if value is not None:
-                    if value >= self.NORMAL_FORM_THRESHOLD:
-                        display_value = self._calculate_normal_form(value)
-                        display_size = 5
-
-                    if value >= 1:
-                        ax.text(
-                            key.y,  # x-coordinate
-                            key.x,  # y-coordinate
-                            display_value,  # Display the number of visits
-                            ha="center",
-                            va="center",  # Center the text
-                            fontsize=display_size,
-                            color="black",
-                            weight="bold",
-                        )
-
-        # GRID LINES
-        # Shift the grid by 0.5 units left and up
-        # Horizontal lines (Shifted)
-        for i in range(maze.size + 1):
-            ax.plot(
-                [0 - self.GRID_SHIFT, maze.size - self.GRID_SHIFT],
-                [i - self.GRID_SHIFT, i - self.GRID_SHIFT],
-                color="gray",
-                linewidth=1,
-                alpha=0.5,
-            )
-
-        # Vertical lines (Shifted)
-        for j in range(maze.size + 1):
-            ax.plot(
-                [j - self.GRID_SHIFT, j - self.GRID_SHIFT],
-                [0 - self.GRID_SHIFT, maze.size - self.GRID_SHIFT],
-                color="gray",
-                linewidth=1,
-                alpha=0.5,
-            )
+        if show_labels and traffic is not None:
+            self._draw_labels(ax, traffic)
+        elif show_labels and maze.solved:
+            self._draw_labels(ax, maze.memory)
+        if show_grid:
+            self._draw_grid(ax, maze.size)
 
         # Display the plot
         plt.show()
 
+    def _console_style(self, maze: Maze, grid: np.ndarray, rows: slice, columns: slice):
+        """Console colour of every cell in the view, an index into CONSOLE_STYLES."""
+        style = np.zeros(grid.shape, dtype=np.uint8)
+        style[grid == Maze.START] = 1
+        style[grid == Maze.EXIT] = 2
+        if maze.solved:
+            style[(grid == Maze.PATH) & (maze.memory[rows, columns] > 0)] = 3
+        return style
+
+    def _exit_label(self, maze: Maze) -> str:
+        solution_value = maze.get_memory_value(maze.exit)
+        if solution_value > self.NORMAL_FORM_THRESHOLD:
+            return self._calculate_normal_form(solution_value)
+        return str(solution_value)
+
+    def render_frame(
+        self,
+        maze: Maze,
+        top: int = 0,
+        left: int = 0,
+        height: int | None = None,
+        width: int | None = None,
+    ) -> str:
+        """Renders the cells of a view of the maze as one string. Neighbouring
+        cells of the same colour share one colour code, so the output holds a
+        code per run rather than per cell."""
+        rows = slice(top, top + height if height is not None else maze.size)
+        columns = slice(left, left + width if width is not None else maze.size)
+        grid = maze.grid[rows, columns]
+        style = self._console_style(maze, grid, rows, columns)
+        cells = self.CONSOLE_CHARACTERS[grid].tolist()
+        if maze.solved:
+            exit_x, exit_y = maze.exit.x - top, maze.exit.y - left
+            if 0 <= exit_x < len(cells) and 0 <= exit_y < len(cells[0]):
+                cells[exit_x][exit_y] = self._exit_label(maze)
+
+        lines: list[str] = list()
+        for row_cells, row_style in zip(cells, style):
+            # Where the colour changes, plus both ends of the row
+            bounds = np.flatnonzero(row_style[1:] != row_style[:-1]) + 1
+            bounds = [0, *bounds.tolist(), len(row_cells)]
+            parts: list[str] = list()
+            for first, last in zip(bounds, bounds[1:]):
+                run = " ".join(row_cells[first:last])
+                code = self.CONSOLE_STYLES[row_style[first]]
+                if code:
+                    run = f"{code}{run}{self.CONSOLE_RESET}"
+                parts.append(run + " ")
+            lines.append("".join(parts))
+        return "\n".join(lines) + "\n"
+
     def display_maze(self, maze: Maze):
-        for x in range(maze.size):
-            for y in range(maze.size):
-                current = Coordinate(x, y)
-                self._display_cell(maze.layout, maze.memory, current)
+        """Writes the whole maze to the console in a single write."""
+        sys.stdout.write(self.render_frame(maze))
+        sys.stdout.flush()
+
+    def fits_console(self, maze: Maze) -> bool:
+        columns, lines = shutil.get_terminal_size()
+        return maze.size * 2 <= columns and maze.size <= lines
 
-            print()  # Newline after each row
+    def page_maze(
+        self,
+        maze: Maze,
+        header: str = "",
+        read_command: Callable[[str], str] = input,
+    ):
+        """Shows the part of the maze that fits the terminal and scrolls through
+        it, so every frame costs the same whatever the maze size. The header
+        is written above every frame."""
+        top, left = 0, 0
+        while True:
+            columns, lines = shutil.get_terminal_size()
+            reserved = self.PAGE_STATUS_LINES + header.count("\n")
+            height = max(lines - reserved, 1)
+            width = max(columns // 2, 1)  # Every cell takes two columns
+            top = min(max(top, 0), max(maze.size - height, 0))
+            left = min(max(left, 0), max(maze.size - width, 0))
+            status = (
+                f"Rows {top}-{min(top + height, maze.size) - 1} and columns "
+                f"{left}-{min(left + width, maze.size) - 1} of {maze.size}     "
+                "[w/a/s/d] Scroll     [q] Back"
+            )
+            sys.stdout.write(
+                self.CONSOLE_CLEAR
+                + header
+                + self.render_frame(maze, top, left, height, width)
+                + status
+                + "\n"
+            )
+            sys.stdout.flush()
+            command = read_command("").strip().lower()
+            if command == "q":
+                return
+            row_step, column_step = self.PAGE_MOVES.get(command, (0, 0))
+            top += row_step * max(height // 2, 1)
+            left += column_step * max(width // 2, 1)
@@ -0,0 +1,51 @@
+import itertools
+from Maze import Maze
+from MazeSolver import MazeSolver
+
+
+class MemoizedSolver(MazeSolver):
+    """Top-down DAG counting from the exit, memoizing every cell it resolves.
+
+    Once the exit is resolved the open cells it did not need are resolved
+    too, so the table holds the count of every cell like the other solvers.
+    """
+
+    NAME = "memoized"
+    COST_PER_CELL = 15.0
+
+    def estimate_cost(self, size: int, wall_density: float) -> float:
+        return self.COST_PER_CELL * size * size * (1 - wall_density)
+
+    def solve(self, maze: Maze) -> None:
+        size = maze.size
+        is_open = (maze.grid != Maze.WALL).ravel().tolist()
+        start = maze.start.x * size + maze.start.y
+        memo: dict[int, int] = {start: 1}
+        roots = itertools.chain([maze.exit.x * size + maze.exit.y], range(size * size))
+        for root in roots:
+            if not is_open[root] or root in memo:
+                continue
+            # Explicit stack instead of recursion, a cell is resolved once
+            # both its down and left neighbours are.
+            stack = [root]
+            while stack:
+                current = stack[-1]
+                if current in memo:
+                    stack.pop()
+                    continue
+                neighbours = list()
+                if current + size < size * size and is_open[current + size]:
+                    neighbours.append(current + size)  # Down
+                if current % size > 0 and is_open[current - 1]:
+                    neighbours.append(current - 1)  # Left
+                pending = [cell for cell in neighbours if cell not in memo]
+                if pending:
+                    stack.extend(pending)
+                else:
+                    memo[current] = sum(memo[cell] for cell in neighbours)
+                    stack.pop()
+
+        counts = [[0] * size for _ in range(size)]
+        for cell, value in memo.items():
+            counts[cell // size][cell % size] = value
+        maze.set_memory(self._counts_to_array(counts))
@@ -7,15 +7,23 @@ from ValidationResult import ValidationResult
 from MazeVisualizer import MazeVisualizer
 from MazeStatVisualizer import MazeStatVisualizer
 from Maze import Maze
-from MazeStat import MazeStat
 from FileReader import FileReader
+from SqliteMazeRepository import SqliteMazeRepository
+from ImportReport import ImportReport
+from ProgressSpinner import ProgressSpinner
 
 
 class Menu:
     PATH = "../../src/data/random_mazes.csv"
-
-    def __init__(self):
-        self.controller = MazeController()
+    # Next to the shipped data, wherever the menu is started from
+    DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "mazes.db")
+
+    def __init__(self, use_maze_pool: bool = False):
+        os.makedirs(os.path.dirname(self.DB_PATH), exist_ok=True)
+        self.controller = MazeController(SqliteMazeRepository(self.DB_PATH))
+        # Off by default, its refill thread would slow down the timed work
+        if use_maze_pool:
+            self.controller.enable_maze_pool()
         self.visualizer = MazeVisualizer()
         self.stat_visualizer = MazeStatVisualizer()
         self.file_reader = FileReader()
@@ -99,14 +107,21 @@ class Menu:
         build_time_str = f"Build time: {stat.build_time}ms"
         solution_time_str = f"Solution time: {stat.solution_time}ms"
         num_of_solutions_str = f"Number of solutions: {stat.num_solutions}"
+        solver_str = f"Solver: {stat.solver}"
 
         # Calculate the total length of the stats line (including spaces)
         stats_line = f"{maze_size_str}     {scarcity_str}     {build_time_str}"
         if stat.solution_time != None:
             stats_line += f"     {solution_time_str}     {num_of_solutions_str}"
+            stats_line += f"     {solver_str}"
         total_length = len(stats_line)
 
         """ FORMATTED DISPLAY """
+        if not self.visualizer.fits_console(maze):
+            # Too big for the terminal, page through it instead
+            header = f"{'-' * total_length}\n{stats_line}\n\n"
+            self.visualizer.page_maze(maze, header)
+            return
         print("-" * total_length)
         print(stats_line)
         print("\n")
@@ -143,49 +158,81 @@ class Menu:
         maze_size = self._get_maze_size()
         scarcity = self._get_scarcity()
 
-        maze = self.controller.create_maze(maze_size, scarcity)
+        with ProgressSpinner() as spinner:
+            maze = self.controller.create_maze(
+                maze_size, scarcity, progress=spinner.report
+            )
 
         return maze
 
+    def _is_plot_traffic(self) -> bool:
+        question = "Would you like to see how many solutions pass each cell? [y/n]: "
+        return self._get_input(question, self._yes_no_validator)
+
     def _show_maze(self, maze: Maze) -> None:
         self._display_maze(maze)
         if self._is_plot_maze():
-            self.visualizer.plot_maze(maze)
+            traffic = None
+            if maze.solved and self._is_plot_traffic():
+                traffic = self.controller.get_paths_through_cells(maze)
+            self.visualizer.plot_maze(maze, traffic=traffic)
 
     def _solve_maze(self, maze: Maze) -> None:
         if self._is_solve_maze():
             self.controller.solve_maze(maze)
 
+    def _format_maze_line(self, maze: Maze) -> str:
+        stat = maze.stat
+        # Format the stats
+        id_str = f"ID: {maze.id}"
+        maze_size_str = f"[ {maze.size - 2} x {maze.size - 2} ]"
+        scarcity_str = f"Scarcity: {int(stat.scarcity * 100)}%"
+        build_time_str = f"Build time: {stat.build_time}ms"
+        solution_time_str = f"Solution time: {stat.solution_time}ms"
+        num_of_solutions_str = f"Number of solutions: {stat.num_solutions}"
+        solver_str = f"Solver: {stat.solver}"
+
+        # Calculate the total length of the stats line (including spaces)
+        stats_line = (
+            f"{id_str}    {maze_size_str}     {scarcity_str}     {build_time_str}"
+        )
+        if stat.solution_time != None:
+            stats_line += f"     {solution_time_str}     {num_of_solutions_str}"
+            stats_line += f"     {solver_str}"
+        return stats_line
+
     def _display_mazes(self, mazes: list[Maze]) -> None:
         """Clears the console and visualizes the maze."""
         # Clear console
         self._clear_console()
         time.sleep(0.2)  # Small delay to ensure clean slate
         for maze in mazes:
-            stat = maze.stat
-            # Format the stats
-            id_str = f"ID: {maze.id}"
-            maze_size_str = f"[ {maze.size - 2} x {maze.size - 2} ]"
-            scarcity_str = f"Scarcity: {int(stat.scarcity * 100)}%"
-            build_time_str = f"Build time: {stat.build_time}ms"
-            solution_time_str = f"Solution time: {stat.solution_time}ms"
-            num_of_solutions_str = f"Number of solutions: {stat.num_solutions}"
-
-            # Calculate the total length of the stats line (including spaces)
-            stats_line = (
-                f"{id_str}    {maze_size_str}     {scarcity_str}     {build_time_str}"
-            )
-            if stat.solution_time != None:
-                stats_line += f"     {solution_time_str}     {num_of_solutions_str}"
-            """ FORMATTED DISPLAY """
-            print(stats_line)
+            """FORMATTED DISPLAY"""
+            print(self._format_maze_line(maze))
         print(f"Number of mazes: {len(mazes)}")
 
-    def _load_from_file(self) -> list[Maze]:
-        df = self.file_reader.read_from_csv(self.PATH)
-        mazes = self.controller.import_mazes(df)
-        self._display_mazes(mazes)
-        return mazes
+    def _display_import_errors(self, report: ImportReport) -> None:
+        if report.has_errors():
+            print(f"Skipped rows: {len(report.errors)}")
+            for line, message in report.errors:
+                print(f"  Line {line}: {message}")
+
+    def _load_from_file(self) -> int:
+        """Imports the file chunk by chunk, printing every maze as it is saved."""
+        chunks = self.file_reader.stream_from_csv(self.PATH)
+        report = ImportReport()
+        # Clear console
+        self._clear_console()
+        time.sleep(0.2)  # Small delay to ensure clean slate
+        num_of_mazes = 0
+        for maze in self.controller.stream_import_mazes(
+            chunks, report, workers=os.cpu_count()
+        ):
+            print(self._format_maze_line(maze))
+            num_of_mazes += 1
+        print(f"Number of mazes: {num_of_mazes}")
+        self._display_import_errors(report)
+        return num_of_mazes
 
     def _select_maze_by_id(self) -> int:
         question = "Which maze would you like to see?: "
@@ -196,30 +243,30 @@ class Menu:
         return self._get_input(question, self._int_validator)
 
     def _display_maze_stats_selection(self) -> None:
-        mazes = self.controller.find_all_mazes()
-        stats: list[MazeStat] = list()
-        for maze in mazes:
-            if maze.stat is not None:
-                stats.append(maze.stat)
+        store = self.controller.get_stat_store()
+        for column in ("build_time", "solution_time"):
+            percentiles = store.percentiles(column)
+            summary = "     ".join(
+                f"p{q}: {round(value, 2)}ms" for q, value in percentiles.items()
+            )
+            print(f"{column.replace('_', ' ').capitalize()}     {summary}")
 
-        self.stat_visualizer.plot(stats)
+        self.stat_visualizer.plot(store)
 
     def _display_maze_selection(self) -> None:
         mazes = self.controller.find_all_mazes()
         self._display_mazes(mazes)
         id = self._select_maze_by_id()
-        if 0 <= id <= len(mazes):
-            maze = self.controller.find_maze_by_id(id)
-            if maze is not None:
-                self._show_maze(maze)
+        maze = self.controller.find_maze_by_id(id)
+        if maze is not None:
+            self._show_maze(maze)
 
     def _import_maze_selection(self) -> None:
-        mazes = self._load_from_file()
+        self._load_from_file()
         id = self._select_maze_by_id()
-        if 0 <= id <= len(mazes):
-            maze = self.controller.find_maze_by_id(id)
-            if maze is not None:
-                self._show_maze(maze)
+        maze = self.controller.find_maze_by_id(id)
+        if maze is not None:
+            self._show_maze(maze)
 
     def _create_and_solve_selection(self) -> None:
         maze = self._create_maze()
@@ -231,10 +278,9 @@ class Menu:
         mazes = self.controller.find_all_mazes()
         self._display_mazes(mazes)
         id = self._delete_maze_by_id()
-        if 0 <= id <= len(mazes):
-            maze = self.controller.remove_maze_by_id(id)
-            if maze is not None:
-                self._show_maze(maze)
+        maze = self.controller.remove_maze_by_id(id)
+        if maze is not None:
+            self._show_maze(maze)
 
     def _exit(self) -> None:
         exit
@@ -0,0 +1,67 @@
+import itertools
+import queue
+import sys
+import threading
+
+
+class ProgressSpinner:
+    """Renders generation progress on its own thread, only on an interactive terminal.
+
+    Use report as the progress callback: it just queues the event, so the
+    generating code never blocks or writes to stdout itself.
+    """
+
+    FRAME_TIME = 0.1
+    SPINNER_FRAMES = ["-", "\\", "|", "/"]
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.enabled = self.stream.isatty()
+        self.events: queue.Queue = queue.Queue()
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def __enter__(self) -> "ProgressSpinner":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def report(self, attempt: int, num_of_tries: int) -> None:
+        if self.enabled:
+            self.events.put_nowait((attempt, num_of_tries))
+
+    def start(self) -> None:
+        if self.enabled and self.thread is None:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._render, daemon=True)
+            self.thread.start()
+
+    def stop(self) -> None:
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+
+    def _render(self) -> None:
+        spinner = itertools.cycle(self.SPINNER_FRAMES)  # Spinner animation
+        latest = None
+        while not self.stop_event.is_set():
+            try:
+                latest = self.events.get(timeout=self.FRAME_TIME)
+                # Only the newest attempt matters for the display
+                while not self.events.empty():
+                    latest = self.events.get_nowait()
+            except queue.Empty:
+                pass
+            if latest is not None:
+                attempt, num_of_tries = latest
+                self.stream.write(
+                    f"\rGenerating solutions, please wait {next(spinner)} "
+                    f"(attempt {attempt}/{num_of_tries}) "
+                )
+                self.stream.flush()
+        if latest is not None:
+            self.stream.write("\n")
+            self.stream.flush()
@@ -0,0 +1,41 @@
+import math
+from Coordinate import Coordinate
+from CoordinateCache import CoordinateCache
+from Maze import Maze
+from MazeSolver import MazeSolver
+
+
+class RecursiveSolver(MazeSolver):
+    """The original solver: walks every path one by one, exponential in their number."""
+
+    NAME = "recursive"
+    MOVEMENT_VECTORS = (Coordinate(-1, 0), Coordinate(0, 1))
+    # Every path is walked cell by cell, but very long walks overflow the stack.
+    MAX_SIZE = 64
+    COST_PER_STEP = 8.0
+
+    def estimate_cost(self, size: int, wall_density: float) -> float:
+        if size > self.MAX_SIZE:
+            return math.inf
+        log2_paths = self._estimate_log2_paths(size, wall_density)
+        return self.COST_PER_STEP * 2 * size * 2 ** min(log2_paths, 1000)
+
+    def _recursive_solve_maze(
+        self, current_pos: Coordinate, maze: Maze, coordinates: CoordinateCache
+    ) -> None:
+        for movement in self.MOVEMENT_VECTORS:
+            new_pos: Coordinate = coordinates.neighbour(current_pos, movement)
+            if maze.is_blockade(new_pos) == False:
+                if maze.memory[new_pos.x, new_pos.y] > 0:
+                    maze.memory[new_pos.x, new_pos.y] += 1
+                else:
+                    maze.memory[new_pos.x, new_pos.y] = maze.memory[
+                        current_pos.x, current_pos.y
+                    ]
+                if new_pos != maze.exit:
+                    self._recursive_solve_maze(new_pos, maze, coordinates)
+
+    def solve(self, maze: Maze) -> None:
+        coordinates = CoordinateCache.for_size(maze.size)
+        self._recursive_solve_maze(maze.start, maze, coordinates)
+        maze.solved = True
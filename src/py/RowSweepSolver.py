@@ -0,0 +1,28 @@
+from Maze import Maze
+from MazeSolver import MazeSolver
+
+
+class RowSweepSolver(MazeSolver):
+    """Dynamic programming over the rows, bottom to top, on plain Python ints."""
+
+    NAME = "row_sweep"
+    COST_PER_CELL = 1.0
+
+    def estimate_cost(self, size: int, wall_density: float) -> float:
+        return self.COST_PER_CELL * size * size
+
+    def solve(self, maze: Maze) -> None:
+        size = maze.size
+        is_open = (maze.grid != Maze.WALL).tolist()
+        counts = [[0] * size for _ in range(size)]
+        counts[maze.start.x][maze.start.y] = 1
+        for x in range(size - 2, 0, -1):
+            row = counts[x]
+            below = counts[x + 1]
+            open_row = is_open[x]
+            for y in range(1, size):
+                if open_row[y]:
+                    # Path count is the sum of the left and down neighbours.
+                    row[y] = row[y - 1] + below[y]
+        counts[maze.exit.x][maze.exit.y] = counts[maze.exit.x + 1][maze.exit.y]
+        maze.set_memory(self._counts_to_array(counts))
@@ -0,0 +1,77 @@
+from collections import OrderedDict
+import hashlib
+import sys
+import numpy as np
+from Maze import Maze
+
+
+class SolutionCache:
+    """Least recently used cache of solved count arrays.
+
+    Entries are keyed by a hash of the grid bytes plus start and exit, so any
+    maze with an identical layout is answered without running a solver.
+    """
+
+    SOLVER_NAME = "cache"
+    MAX_ENTRIES = 64
+    MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (counts, solver name, size in bytes)
+        self.entries: OrderedDict[bytes, tuple[np.ndarray, str, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, maze: Maze) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            np.array(maze.grid.shape + (maze.start.x, maze.start.y)).tobytes()
+        )
+        digest.update(np.array((maze.exit.x, maze.exit.y)).tobytes())
+        digest.update(np.ascontiguousarray(maze.grid).tobytes())
+        return digest.digest()
+
+    def _size_of(self, memory: np.ndarray) -> int:
+        if memory.dtype != object:
+            return memory.nbytes
+        # Every cell is at most as large as the biggest count
+        return memory.nbytes + memory.size * sys.getsizeof(memory.max())
+
+    def get(self, key: bytes) -> tuple[np.ndarray, str] | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, key: bytes, memory: np.ndarray, solver: str) -> None:
+        size = self._size_of(memory)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[2]
+        # Shared with the mazes that get it, so nobody may write into it
+        memory.setflags(write=False)
+        self.entries[key] = (memory, solver, size)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            self.bytes -= self.entries.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
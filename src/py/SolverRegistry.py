@@ -0,0 +1,26 @@
+from Maze import Maze
+from MazeSolver import MazeSolver
+
+
+class SolverRegistry:
+    def __init__(self):
+        self.solvers: dict[str, MazeSolver] = dict()
+
+    def register(self, solver: MazeSolver) -> None:
+        self.solvers[solver.NAME] = solver
+
+    def get(self, name: str) -> MazeSolver:
+        if name not in self.solvers:
+            raise ValueError(f"Unknown solver: {name}")
+        return self.solvers.get(name)
+
+    def names(self) -> list[str]:
+        return list(self.solvers.keys())
+
+    def select(self, maze: Maze) -> MazeSolver:
+        """Picks the solver with the lowest estimated cost for this maze."""
+        wall_density = maze.wall_density()
+        return min(
+            self.solvers.values(),
+            key=lambda solver: solver.estimate_cost(maze.size, wall_density),
+        )
@@ -0,0 +1,203 @@
+import json
+import sqlite3
+import zlib
+import numpy as np
+from Coordinate import Coordinate
+from LazyMaze import LazyMaze
+from Maze import Maze
+from MazeStat import MazeStat
+
+
+class SqliteMazeRepository:
+    """Keeps the mazes in a SQLite file so they outlive the session.
+
+    Stats are plain, indexed columns; the grid and the count array are stored
+    as compressed blobs that are only read once a maze's layout is used.
+    """
+
+    STAT_COLUMNS = (
+        "size",
+        "start_x",
+        "start_y",
+        "exit_x",
+        "exit_y",
+        "solved",
+        "solver",
+        "seed",
+        "constructive",
+        "scarcity",
+        "build_time",
+        "solution_time",
+        "num_solutions",
+        "profile",
+    )
+    LAYOUT_COLUMNS = ("grid", "memory", "memory_dtype")
+
+    def __init__(self, path: str = ":memory:"):
+        self.connection = sqlite3.connect(path)
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS mazes (
+                id INTEGER PRIMARY KEY,
+                size INTEGER NOT NULL,
+                start_x INTEGER NOT NULL,
+                start_y INTEGER NOT NULL,
+                exit_x INTEGER NOT NULL,
+                exit_y INTEGER NOT NULL,
+                solved INTEGER NOT NULL,
+                solver TEXT,
+                seed TEXT,
+                constructive INTEGER NOT NULL,
+                scarcity REAL,
+                build_time REAL,
+                solution_time REAL,
+                num_solutions TEXT,
+                profile TEXT,
+                grid BLOB NOT NULL,
+                memory BLOB,
+                memory_dtype TEXT
+            );
+            CREATE INDEX IF NOT EXISTS mazes_size ON mazes (size);
+            CREATE INDEX IF NOT EXISTS mazes_scarcity ON mazes (scarcity);
+            CREATE INDEX IF NOT EXISTS mazes_build_time ON mazes (build_time);
+            CREATE INDEX IF NOT EXISTS mazes_solution_time ON mazes (solution_time);
+            """)
+        columns = [
+            row[1] for row in self.connection.execute("PRAGMA table_info(mazes)")
+        ]
+        if "profile" not in columns:
+            # Databases from before the phase timings
+            self.connection.execute("ALTER TABLE mazes ADD COLUMN profile TEXT")
+        self.connection.commit()
+
+    def _encode_memory(self, memory: np.ndarray) -> tuple[bytes, str]:
+        if memory.dtype == object:
+            # Counts beyond int64 are stored as decimal text, one per cell.
+            text = " ".join(str(value) for value in memory.ravel())
+            return zlib.compress(text.encode("ascii")), "decimal"
+        return zlib.compress(memory.astype(np.int64).tobytes()), "int64"
+
+    def _decode_memory(self, blob: bytes, dtype: str, size: int) -> np.ndarray:
+        data = zlib.decompress(blob)
+        if dtype == "decimal":
+            values = [int(value) for value in data.decode("ascii").split()]
+            return np.array(values, dtype=object).reshape(size, size)
+        return np.frombuffer(data, dtype=np.int64).reshape(size, size).copy()
+
+    def _stat_values(self, maze: Maze) -> tuple:
+        stat = maze.stat
+        seed = str(maze.seed) if maze.seed is not None else None
+        values = (
+            maze.size,
+            maze.start.x,
+            maze.start.y,
+            maze.exit.x,
+            maze.exit.y,
+            int(maze.solved),
+            maze.solver,
+            seed,
+            int(maze.constructive),
+        )
+        if stat is None:
+            return values + (None, None, None, None, None)
+        num_solutions = stat.num_solutions
+        return values + (
+            stat.scarcity,
+            stat.build_time,
+            stat.solution_time,
+            str(num_solutions) if num_solutions is not None else None,
+            json.dumps(stat.profile()),
+        )
+
+    def _layout_values(self, maze: Maze) -> tuple:
+        grid = zlib.compress(np.ascontiguousarray(maze.grid, dtype=np.uint8).tobytes())
+        if not maze.solved:
+            return (grid, None, None)
+        return (grid,) + self._encode_memory(maze.memory)
+
+    def _next_id(self) -> int:
+        row = self.connection.execute("SELECT MAX(id) FROM mazes").fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def save_or_update_maze(self, maze: Maze) -> Maze:
+        if maze.id == None:
+            maze.id = self._next_id()
+
+        if isinstance(maze, LazyMaze) and not maze.is_loaded():
+            # Only the stats can have changed, leave the blobs alone.
+            assignments = ", ".join(f"{column} = ?" for column in self.STAT_COLUMNS)
+            self.connection.execute(
+                f"UPDATE mazes SET {assignments} WHERE id = ?",
+                self._stat_values(maze) + (maze.id,),
+            )
+        else:
+            columns = ("id",) + self.STAT_COLUMNS + self.LAYOUT_COLUMNS
+            placeholders = ", ".join("?" for _ in columns)
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO mazes ({', '.join(columns)}) "
+                f"VALUES ({placeholders})",
+                (maze.id,) + self._stat_values(maze) + self._layout_values(maze),
+            )
+        self.connection.commit()
+        return maze
+
+    def remove_maze(self, id: int) -> None:
+        self.connection.execute("DELETE FROM mazes WHERE id = ?", (id,))
+        self.connection.commit()
+
+    def _load_grid(self, id: int, size: int) -> np.ndarray:
+        (grid_blob,) = self.connection.execute(
+            "SELECT grid FROM mazes WHERE id = ?", (id,)
+        ).fetchone()
+        grid = np.frombuffer(zlib.decompress(grid_blob), dtype=np.uint8)
+        return grid.reshape(size, size).copy()
+
+    def _load_memory(self, id: int, size: int) -> np.ndarray | None:
+        memory_blob, memory_dtype = self.connection.execute(
+            "SELECT memory, memory_dtype FROM mazes WHERE id = ?", (id,)
+        ).fetchone()
+        if memory_blob is not None:
+            return self._decode_memory(memory_blob, memory_dtype, size)
+
+    def _maze_from_row(self, row: tuple) -> LazyMaze:
+        id, size, start_x, start_y, exit_x, exit_y, solved, solver, seed = row[:9]
+        constructive, scarcity, build_time, solution_time, num_solutions = row[9:14]
+        profile = row[14]
+        maze = LazyMaze(
+            Coordinate(start_x, start_y),
+            Coordinate(exit_x, exit_y),
+            size,
+            lambda: self._load_grid(id, size),
+            lambda: self._load_memory(id, size),
+        )
+        maze.id = id
+        maze.solved = bool(solved)
+        maze.solver = solver
+        maze.seed = int(seed) if seed is not None else None
+        maze.constructive = bool(constructive)
+        if scarcity is not None:
+            stat = MazeStat(size, scarcity, build_time, maze.seed, maze.constructive)
+            stat.set_solution_time(solution_time)
+            if num_solutions is not None:
+                stat.set_num_solutions(int(num_solutions))
+            stat.set_solver(solver)
+            if profile is not None:
+                stat.set_profile(json.loads(profile))
+            maze.set_stat(stat)
+        return maze
+
+    def _select_stats(self, where: str = "", parameters: tuple = ()) -> list:
+        columns = ", ".join(("id",) + self.STAT_COLUMNS)
+        return self.connection.execute(
+            f"SELECT {columns} FROM mazes {where} ORDER BY id", parameters
+        ).fetchall()
+
+    def get_maze(self, id: int) -> Maze:
+        rows = self._select_stats("WHERE id = ?", (id,))
+        if rows:
+            return self._maze_from_row(rows[0])
+
+    def get_all_mazes(self) -> list[Maze]:
+        return [self._maze_from_row(row) for row in self._select_stats()]
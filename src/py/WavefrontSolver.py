@@ -0,0 +1,79 @@
+import numpy as np
+from Maze import Maze
+from MazeRecorder import MazeRecorder
+from MazeSolver import MazeSolver
+
+
+class WavefrontSolver(MazeSolver):
+    """Counts up/right paths one anti-diagonal at a time with NumPy.
+
+    A cell's count only depends on its left and down neighbours, which both lie
+    on the previous anti-diagonal, so a whole diagonal is filled in one step.
+    """
+
+    NAME = "wavefront"
+    # Beyond this, adding two neighbours could overflow int64.
+    OVERFLOW_LIMIT = np.iinfo(np.int64).max // 2
+    COST_PER_STEP = 50.0
+    COST_PER_CELL = 0.3
+    COST_PER_OVERFLOWED_CELL = 1.5
+
+    def estimate_cost(self, size: int, wall_density: float) -> float:
+        cost = 2 * size * self.COST_PER_STEP + size * size * self.COST_PER_CELL
+        if self._estimate_log2_paths(size, wall_density) > 62:
+            cost += size * size * self.COST_PER_OVERFLOWED_CELL
+        return cost
+
+    def _skew_indices(self, size: int) -> tuple:
+        """Index arrays mapping (row, column) to (diagonal, row + 1) in the skewed grid."""
+        rows = np.arange(size)[:, np.newaxis]
+        columns = np.arange(size)[np.newaxis, :]
+        return rows + columns, rows + 1
+
+    def count_paths(
+        self,
+        is_open: np.ndarray,
+        source: tuple,
+        recorder: MazeRecorder | None = None,
+    ) -> np.ndarray:
+        """Returns the number of up/right paths from source to every cell.
+        A recorder gets the reached cells of every diagonal as a step."""
+        size = is_open.shape[0]
+        # Flip vertically so "down" is the previous row, then store every
+        # anti-diagonal as one contiguous row. Column 0 is padding, so the down
+        # neighbour of (diagonal, i) is (diagonal - 1, i - 1) and the left one
+        # is (diagonal - 1, i).
+        diagonals, positions = self._skew_indices(size)
+        skewed_open = np.zeros((2 * size - 1, size + 1), dtype=bool)
+        skewed_open[diagonals, positions] = is_open[::-1]
+        counts = np.zeros(skewed_open.shape, dtype=np.int64)
+
+        source_row = size - 1 - source[0]
+        source_diagonal = source_row + source[1]
+        largest = 0
+        for diagonal in range(2 * size - 1):
+            if counts.dtype != object and largest > self.OVERFLOW_LIMIT:
+                # Continue with exact Python ints from here on.
+                counts = counts.astype(object)
+
+            previous = counts[diagonal - 1] if diagonal > 0 else counts[0]
+            values = skewed_open[diagonal, 1:] * (previous[:-1] + previous[1:])
+            counts[diagonal, 1:] = values
+            if diagonal == source_diagonal:
+                counts[diagonal, source_row + 1] = 1
+            if counts.dtype != object:
+                largest = values.max()
+            if recorder is not None:
+                # Undo the skew and the vertical flip for the reached cells
+                reached = np.flatnonzero(counts[diagonal, 1:])
+                if len(reached):
+                    rows = size - 1 - reached
+                    columns = diagonal - reached
+                    recorder.coordinates(rows, columns, MazeRecorder.SOLUTION)
+
+        return counts[diagonals[::-1], positions[::-1]]
+
+    def solve(self, maze: Maze, recorder: MazeRecorder | None = None) -> None:
+        is_open = maze.grid != Maze.WALL
+        source = (maze.start.x, maze.start.y)
+        maze.set_memory(self.count_paths(is_open, source, recorder))
@@ -1,8 +1,16 @@
+import argparse
 from Menu import Menu
 
 
 def main():
-    menu = Menu()
+    parser = argparse.ArgumentParser(description="Maze generator and solver")
+    parser.add_argument(
+        "--maze-pool",
+        action="store_true",
+        help="Pre-generate mazes for often used parameters in the background",
+    )
+    args = parser.parse_args()
+    menu = Menu(args.maze_pool)
     menu.run()
 
 